@@ -3,17 +3,89 @@ from __future__ import annotations
 
 import ast
 import hashlib
+import io
 import os
 import re
+import sys
+import tokenize
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Set, Any
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from .schema import (
     ProjectAnalysis, ProjectInfo, ProjectTotals, FileAnalysis,
     ClassInfo, FunctionInfo, ImportInfo, ComplexityInfo, UIInfo,
-    ProjectGraphs, DependencyGraph, GraphNode, GraphEdge
+    ProjectGraphs, DependencyGraph, GRAPH_EDGE_TYPES
 )
-from report import ProjectReport, FileInfo
+from config import get_config_manager
+from report import ProjectReport, FileInfo, now_stamp
+from scan import iter_scanned_files, scan_project
+
+# Below this many files, worker start-up costs more than parallel parsing saves
+_PARALLEL_MIN_FILES = 16
+
+# Per-file analysis cache, kept in the app config directory (one subdirectory
+# per project root) so nothing is written into the user's project
+CACHE_DIR_NAME = "analysis_cache"
+# Bump when _analyze_file output changes so stale entries are ignored
+_CACHE_VERSION = "2"
+
+
+@lru_cache(maxsize=64)
+def _cache_dir(project_root: str) -> Path:
+    """Analysis cache directory for a project root."""
+    digest = hashlib.blake2b(str(Path(project_root).resolve()).encode('utf-8'), digest_size=16).hexdigest()
+    return get_config_manager().config_path.parent / CACHE_DIR_NAME / digest
+
+
+# Files hashed per update() call when fingerprinting
+_FINGERPRINT_BATCH = 1024
+
+# File extension -> language label (labels are compile-time constants, so already interned)
+_LANGUAGE_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.html': 'html',
+    '.css': 'css',
+    '.md': 'markdown',
+    '.json': 'json',
+    '.yml': 'yaml',
+    '.yaml': 'yaml',
+    '.toml': 'toml',
+    '.ini': 'ini',
+    '.cfg': 'config',
+    '.txt': 'text',
+}
+
+# Edge type codes for the import graph arrays
+_INTERNAL_EDGE = GRAPH_EDGE_TYPES.index("internal_import")
+_EXTERNAL_EDGE = GRAPH_EDGE_TYPES.index("external_import")
+
+# Comment markers counted as outstanding work items
+_TODO_RE = re.compile(r'#\s*(?:TODO|FIXME|XXX)', re.IGNORECASE)
+
+# CPython 3.13+ can return a constant-folded AST, which is smaller to traverse
+_PARSE_OPTIONS = {'optimize': 1} if sys.version_info >= (3, 13) else {}
+
+# Tokens that never start or end a statement for the import-only scan
+_SKIPPED_TOKENS = frozenset({
+    tokenize.NL, tokenize.COMMENT, tokenize.INDENT, tokenize.DEDENT, tokenize.ENCODING,
+})
+# Top-level tokens after which a file's import header is considered finished
+_HEADER_END_KEYWORDS = frozenset({'def', 'class', 'async', '@'})
+
+# Statement-list fields; everything we classify lives in one of these, so
+# expression subtrees never need to be visited
+_BODY_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+# Nodes that add a branch to the cyclomatic estimate
+_BRANCH_TYPES = frozenset({
+    ast.If, ast.While, ast.For, ast.AsyncFor, ast.With, ast.AsyncWith, ast.ExceptHandler,
+})
 
 
 class AnalysisEngine:
@@ -27,11 +99,91 @@ class AnalysisEngine:
             'qt': ['QWidget', 'QMainWindow', 'QPushButton', 'QLabel', 'QLineEdit'],
             'gtk': ['Gtk.Window', 'Gtk.Button', 'Gtk.Label', 'Gtk.Entry'],
         }
+        # Exact AST node type -> classifier used by _analyze_python_content
+        self._node_handlers = {
+            ast.Import: self._handle_import,
+            ast.ImportFrom: self._handle_import_from,
+            ast.ClassDef: self._handle_class,
+            ast.FunctionDef: self._handle_function,
+            ast.AsyncFunctionDef: self._handle_function,
+        }
+        # path -> (content, parsed module), filled with options['keep_ast'] so
+        # later passes skip re-parsing; kept off FileInfo so reports never serialize it
+        self._ast_trees: Dict[str, Tuple[str, ast.Module]] = {}
     
     def analyze_project(self, project_report: ProjectReport, options: Dict[str, Any] | None = None) -> ProjectAnalysis:
         """Convert ProjectReport to ProjectAnalysis."""
         options = options or {}
+        file_analyses = self._analyze_files(project_report, options)
+        return self._build_analysis(project_report, file_analyses, options)
+    
+    def scan_and_analyze(
+        self,
+        root_path: Path,
+        options: Dict[str, Any] | None = None,
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[ProjectReport, ProjectAnalysis]:
+        """Scan a project and analyze files while the remaining reads are still running.
+        
+        Equivalent to ``scan_project`` followed by ``analyze_project``, but files are
+        handed to worker processes as soon as their content has been read.
+        """
+        options = options or {}
+        try:
+            project_report, file_analyses = self._scan_and_analyze_streaming(root_path, options, progress_callback)
+        except (OSError, BrokenProcessPool):
+            # Process pools can be unavailable (sandboxes, frozen apps); rescan serially
+            project_report = scan_project(root_path, progress_callback)
+            file_analyses = [
+                self._analyze_file(file_info, project_report.root, options) for file_info in project_report.files
+            ]
+        return project_report, self._build_analysis(project_report, file_analyses, options)
+    
+    def _scan_and_analyze_streaming(
+        self,
+        root_path: Path,
+        options: Dict[str, Any],
+        progress_callback: Optional[Callable[[str], None]],
+    ) -> Tuple[ProjectReport, List[FileAnalysis]]:
+        """Consume the scan stream, starting worker processes once the project is large enough."""
+        root = str(root_path)
+        workers = self._worker_count(options)
+        files: List[FileInfo] = []
+        futures: List[Future] = []
+        executor = None
+        
+        try:
+            for file_info in iter_scanned_files(root_path, progress_callback):
+                files.append(file_info)
+                if executor is not None:
+                    futures.append(executor.submit(self._analyze_file, file_info, root, options))
+                elif workers > 1 and len(files) >= _PARALLEL_MIN_FILES:
+                    executor = ProcessPoolExecutor(max_workers=workers)
+                    futures = [executor.submit(self._analyze_file, fi, root, options) for fi in files]
+            
+            if executor is None:
+                file_analyses = [self._analyze_file(file_info, root, options) for file_info in files]
+            else:
+                file_analyses = [future.result() for future in futures]
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
         
+        if progress_callback:
+            progress_callback("Scan complete!")
+        
+        # Match scan_project's ordering for consistent output
+        order = sorted(range(len(files)), key=lambda i: files[i].path.lower())
+        project_report = ProjectReport(root=root, generated_at=now_stamp(), files=[files[i] for i in order])
+        return project_report, [file_analyses[i] for i in order]
+    
+    def _build_analysis(
+        self,
+        project_report: ProjectReport,
+        file_analyses: List[FileAnalysis],
+        options: Dict[str, Any],
+    ) -> ProjectAnalysis:
+        """Assemble totals, fingerprint and graphs around per-file analyses."""
         # Calculate project fingerprint
         fingerprint = self._calculate_fingerprint(project_report)
         
@@ -40,14 +192,9 @@ class AnalysisEngine:
         total_sloc = 0
         total_size = 0
         
-        # Analyze each file
-        file_analyses = []
         all_imports = {'internal': set(), 'external': set()}
         
-        for file_info in project_report.files:
-            analysis = self._analyze_file(file_info, project_report.root, options)
-            file_analyses.append(analysis)
-            
+        for analysis in file_analyses:
             total_sloc += analysis.sloc
             total_size += analysis.size_bytes
             
@@ -74,13 +221,70 @@ class AnalysisEngine:
             graphs=ProjectGraphs(imports=import_graph)
         )
     
+    def _analyze_files(self, project_report: ProjectReport, options: Dict[str, Any]) -> List[FileAnalysis]:
+        """Analyze all files, fanning out to worker processes for larger projects."""
+        files = project_report.files
+        workers = self._worker_count(options)
+        
+        if workers > 1 and len(files) >= _PARALLEL_MIN_FILES:
+            worker = partial(self._analyze_file, project_root=project_report.root, options=options)
+            chunksize = max(1, len(files) // (4 * workers))
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(executor.map(worker, files, chunksize=chunksize))
+            except (OSError, BrokenProcessPool):
+                # Process pools can be unavailable (sandboxes, frozen apps); stay serial
+                pass
+        
+        return [self._analyze_file(file_info, project_report.root, options) for file_info in files]
+    
+    def _worker_count(self, options: Dict[str, Any]) -> int:
+        """Number of analysis processes to use for these options."""
+        if options.get('keep_ast'):
+            # Trees parsed in worker processes would never reach this engine
+            return 1
+        return options.get('workers') or os.cpu_count() or 1
+    
     def _analyze_file(self, file_info: FileInfo, project_root: str, options: Dict[str, Any] | None) -> FileAnalysis:
-        """Analyze a single file."""
-        file_path = Path(project_root) / file_info.path
+        """Analyze a single file, reusing a cached result when it is unchanged."""
+        options = options or {}
+        imports_only = bool(options.get('imports_only'))
+        
+        cache_path = None
+        # Contentless runs (content excluded or deselected) must neither read
+        # nor write entries, or they would shadow real results for the file
+        if options.get('cache', True) and file_info.mtime_ns and file_info.content is not None:
+            cache_path = self._cache_path(file_info, project_root, imports_only)
+            try:
+                return FileAnalysis.model_validate_json(cache_path.read_bytes())
+            except (OSError, ValueError):
+                pass
+        
+        analysis = self._analyze_file_uncached(file_info, bool(options.get('keep_ast')), imports_only)
         
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_bytes(analysis.model_dump_json().encode('utf-8'))
+            except OSError:
+                # Read-only projects simply run uncached
+                pass
+        
+        return analysis
+    
+    def _cache_path(self, file_info: FileInfo, project_root: str, imports_only: bool = False) -> Path:
+        """Location of the cached analysis for a file's current (path, size, mtime)."""
+        mode = "imports" if imports_only else "full"
+        key_src = f"{_CACHE_VERSION}:{mode}:{file_info.path}:{file_info.size_bytes}:{file_info.mtime_ns}"
+        key = hashlib.blake2b(key_src.encode('utf-8'), digest_size=16).hexdigest()
+        return _cache_dir(project_root) / key[:2] / key
+    
+    def _analyze_file_uncached(self, file_info: FileInfo, keep_ast: bool = False, imports_only: bool = False) -> FileAnalysis:
+        """Analyze a single file."""
         # Basic file info
-        analysis = FileAnalysis(
+        analysis = FileAnalysis.model_construct(
             path=file_info.path,
+            module_name=self._module_name(file_info.path),
             language=self._detect_language(file_info.path),
             size_bytes=file_info.size_bytes,
             sloc=file_info.lines if isinstance(file_info.lines, int) else 0
@@ -88,119 +292,224 @@ class AnalysisEngine:
         
         # Parse content if available
         if file_info.content and analysis.language == "python":
-            self._analyze_python_content(file_info.content, analysis)
+            if imports_only:
+                internal, external = self._extract_imports_fast(file_info.content)
+                analysis.imports = ImportInfo(internal=internal, external=external)
+            else:
+                self._analyze_python_content(file_info, analysis, keep_ast)
         
         # Infer responsibility
         analysis.responsibility = self._infer_responsibility(file_info.path, analysis)
         
         return analysis
     
-    def _analyze_python_content(self, content: str, analysis: FileAnalysis) -> None:
-        """Analyze Python file content using AST."""
+    def _analyze_python_content(self, file_info: FileInfo, analysis: FileAnalysis, keep_ast: bool = False) -> None:
+        """Analyze Python file content using AST.
+        
+        Reuses a tree kept for the same path and content; with ``keep_ast`` a
+        freshly parsed tree is kept for later passes.
+        """
+        content = file_info.content
         try:
-            tree = ast.parse(content)
+            kept = self._ast_trees.get(file_info.path)
+            if kept is not None and kept[0] == content:
+                tree = kept[1]
+            else:
+                tree = ast.parse(content, **_PARSE_OPTIONS)
+                if keep_ast:
+                    self._ast_trees[file_info.path] = (content, tree)
             
             # Extract imports, classes, and functions
-            imports = {'internal': [], 'external': []}
-            classes = []
-            functions = []
-            tests = []
-            ui_elements = {'windows': [], 'widgets': [], 'callbacks': []}
-            complexity = {'cyclomatic': 0, 'todo_count': 0}
+            state = {
+                'path': analysis.path,
+                'imports': {'internal': [], 'external': []},
+                'classes': [],
+                'functions': [],
+                'tests': [],
+                'ui_elements': {'windows': [], 'widgets': [], 'callbacks': []},
+                'cyclomatic': 0,
+            }
             
             # Count TODO/FIXME items
-            complexity['todo_count'] = len(re.findall(r'#\s*(TODO|FIXME|XXX)', content, re.IGNORECASE))
+            todo_count = sum(1 for _ in _TODO_RE.finditer(content))
             
-            for node in ast.walk(tree):
-                # Handle imports
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        imports['external'].append(alias.name)
-                elif isinstance(node, ast.ImportFrom):
-                    module = node.module or ""
-                    if module.startswith('.'):
-                        imports['internal'].append(module)
-                    else:
-                        imports['external'].append(module)
+            # Depth-first over statements only, in source order
+            handlers = self._node_handlers
+            stack = tree.body[::-1]
+            while stack:
+                node = stack.pop()
+                for field in _BODY_FIELDS:
+                    children = getattr(node, field, None)
+                    if children:
+                        stack.extend(reversed(children))
                 
-                # Handle classes
-                elif isinstance(node, ast.ClassDef):
-                    bases = [self._ast_to_string(base) for base in node.bases]
-                    methods = [n.name for n in node.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]
-                    doc = ast.get_docstring(node)
-                    
-                    classes.append(ClassInfo(
-                        name=node.name,
-                        bases=bases,
-                        methods=methods,
-                        doc1=doc.split('\n')[0] if doc else None,
-                        lineno=node.lineno
-                    ))
-                    
-                    # Check for UI elements
-                    for base in bases:
-                        self._check_ui_element(base, ui_elements)
-                
-                # Handle functions
-                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    signature = self._format_function_signature(node)
-                    doc = ast.get_docstring(node)
-                    returns = self._ast_to_string(node.returns) if node.returns else None
-                    
-                    func_info = FunctionInfo(
-                        name=node.name,
-                        signature=signature,
-                        returns=returns,
-                        doc1=doc.split('\n')[0] if doc else None,
-                        lineno=node.lineno
-                    )
-                    functions.append(func_info)
-                    
-                    # Check if it's a test
-                    if node.name.startswith('test_') or 'test' in analysis.path.lower():
-                        tests.append(f"{analysis.path}::{node.name}")
-                    
-                    # Estimate cyclomatic complexity (basic approximation)
-                    complexity['cyclomatic'] += self._estimate_complexity(node)
+                # AST node classes are leaf types, so exact-type lookup is safe
+                node_type = type(node)
+                handler = handlers.get(node_type)
+                if handler is not None:
+                    handler(node, state)
+                elif node_type in _BRANCH_TYPES:
+                    # Branch points feed the cyclomatic estimate (basic approximation)
+                    state['cyclomatic'] += 1
+            
+            # Each function contributes a base complexity of 1
+            functions = state['functions']
+            cyclomatic = state['cyclomatic'] + len(functions)
             
-            # Update analysis
+            # Update analysis; FileAnalysis is built from trusted parser output,
+            # so pydantic validation is skipped via model_construct
             analysis.imports = ImportInfo(
-                internal=imports['internal'],
-                external=imports['external']
+                internal=state['imports']['internal'],
+                external=state['imports']['external']
             )
-            analysis.classes = classes
+            analysis.classes = state['classes']
             analysis.functions = functions
-            analysis.tests = tests
-            analysis.ui = UIInfo(**ui_elements)
+            analysis.tests = state['tests']
+            analysis.ui = UIInfo(**state['ui_elements'])
             analysis.complexity = ComplexityInfo(
-                cyclomatic=complexity['cyclomatic'],
-                todo_count=complexity['todo_count'],
-                hotspot=min(complexity['cyclomatic'] * 0.1 + complexity['todo_count'] * 0.2, 10.0)
+                cyclomatic=cyclomatic,
+                todo_count=todo_count,
+                hotspot=min(cyclomatic * 0.1 + todo_count * 0.2, 10.0)
             )
             
         except SyntaxError:
             # If parsing fails, just skip AST analysis
             pass
     
+    def _extract_imports_fast(self, content: str) -> tuple[List[str], List[str]]:
+        """Collect header imports with the tokenizer instead of a full parse.
+        
+        Scanning stops at the first top-level ``def``/``class``/decorator, so
+        imports inside function bodies are not seen. Module names are recorded
+        the same way as the AST path does.
+        """
+        internal: List[str] = []
+        external: List[str] = []
+        statement: List[tokenize.TokenInfo] = []
+        
+        try:
+            for tok in tokenize.generate_tokens(io.StringIO(content).readline):
+                tok_type = tok.type
+                if tok_type in _SKIPPED_TOKENS:
+                    continue
+                if tok_type == tokenize.NEWLINE or tok_type == tokenize.ENDMARKER or tok.string == ';':
+                    if statement:
+                        self._collect_import_tokens(statement, internal, external)
+                        statement = []
+                    continue
+                if not statement and tok.start[1] == 0 and tok.string in _HEADER_END_KEYWORDS:
+                    break
+                statement.append(tok)
+        except (tokenize.TokenError, SyntaxError):
+            # Incomplete or invalid source: keep whatever was collected
+            pass
+        
+        return internal, external
+    
+    def _collect_import_tokens(self, statement: List[tokenize.TokenInfo], internal: List[str], external: List[str]) -> None:
+        """Record the module names of one tokenized import statement."""
+        keyword = statement[0].string
+        if keyword == 'import':
+            # import a.b as c, d
+            name: List[str] = []
+            skip = False
+            for tok in statement[1:] + [None]:
+                if tok is None or tok.string == ',':
+                    if name:
+                        external.append(sys.intern(''.join(name)))
+                    name = []
+                    skip = False
+                elif tok.string == 'as':
+                    skip = True
+                elif not skip:
+                    name.append(tok.string)
+        elif keyword == 'from':
+            # from ..a.b import c  -> relative dots are not part of the module name
+            name = []
+            for tok in statement[1:]:
+                if tok.string == 'import':
+                    break
+                if tok.type == tokenize.NAME:
+                    name.append(tok.string)
+            module = sys.intern('.'.join(name))
+            if module.startswith('.'):
+                internal.append(module)
+            else:
+                external.append(module)
+    
+    def _handle_import(self, node: ast.Import, state: Dict[str, Any]) -> None:
+        """Record plain ``import x`` statements."""
+        for alias in node.names:
+            state['imports']['external'].append(sys.intern(alias.name))
+    
+    def _handle_import_from(self, node: ast.ImportFrom, state: Dict[str, Any]) -> None:
+        """Record ``from x import y`` statements."""
+        module = sys.intern(node.module or "")
+        if module.startswith('.'):
+            state['imports']['internal'].append(module)
+        else:
+            state['imports']['external'].append(module)
+    
+    def _handle_class(self, node: ast.ClassDef, state: Dict[str, Any]) -> None:
+        """Record a class definition and any UI bases it derives from."""
+        bases = [self._ast_to_string(base) for base in node.bases]
+        methods = [n.name for n in node.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]
+        doc = ast.get_docstring(node)
+        
+        state['classes'].append(ClassInfo(
+            name=node.name,
+            bases=bases,
+            methods=methods,
+            doc1=doc.split('\n')[0] if doc else None,
+            lineno=node.lineno
+        ))
+        
+        # Check for UI elements
+        for base in bases:
+            self._check_ui_element(base, state['ui_elements'])
+    
+    def _handle_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef, state: Dict[str, Any]) -> None:
+        """Record a function definition and whether it looks like a test."""
+        to_string = self._ast_to_string
+        args = node.args
+        
+        # Signature: regular arguments, then *args and **kwargs
+        parts = [
+            arg.arg if arg.annotation is None else arg.arg + ': ' + to_string(arg.annotation)
+            for arg in args.args
+        ]
+        if args.vararg:
+            parts.append('*' + args.vararg.arg)
+        if args.kwarg:
+            parts.append('**' + args.kwarg.arg)
+        prefix = "async " if type(node) is ast.AsyncFunctionDef else ""
+        signature = f"{prefix}{node.name}({', '.join(parts)})"
+        
+        doc = ast.get_docstring(node)
+        returns = to_string(node.returns) if node.returns else None
+        
+        state['functions'].append(FunctionInfo(
+            name=node.name,
+            signature=signature,
+            returns=returns,
+            doc1=doc.split('\n')[0] if doc else None,
+            lineno=node.lineno
+        ))
+        
+        # Check if it's a test
+        path = state['path']
+        if node.name.startswith('test_') or 'test' in path.lower():
+            state['tests'].append(f"{path}::{node.name}")
+    
+    def _module_name(self, file_path: str) -> str:
+        """Dotted module id for a project-relative path (either separator style)."""
+        return sys.intern(file_path.removesuffix('.py').replace('/', '.').replace(os.sep, '.'))
+    
     def _detect_language(self, file_path: str) -> str:
         """Detect programming language from file extension."""
-        ext = Path(file_path).suffix.lower()
-        language_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.html': 'html',
-            '.css': 'css',
-            '.md': 'markdown',
-            '.json': 'json',
-            '.yml': 'yaml',
-            '.yaml': 'yaml',
-            '.toml': 'toml',
-            '.ini': 'ini',
-            '.cfg': 'config',
-            '.txt': 'text',
-        }
-        return language_map.get(ext, 'unknown')
+        # String splitext avoids building a Path per file
+        ext = os.path.splitext(file_path)[1].lower()
+        return _LANGUAGE_MAP.get(ext, 'unknown')
     
     def _infer_responsibility(self, file_path: str, analysis: FileAnalysis) -> str:
         """Infer the purpose/responsibility of a file."""
@@ -233,6 +542,20 @@ class AnalysisEngine:
     
     def _ast_to_string(self, node: ast.AST) -> str:
         """Convert AST node to string representation."""
+        # Plain and dotted names dominate bases/annotations; render them
+        # without going through ast.unparse
+        if type(node) is ast.Name:
+            return node.id
+        if type(node) is ast.Attribute:
+            parts = [node.attr]
+            value = node.value
+            while type(value) is ast.Attribute:
+                parts.append(value.attr)
+                value = value.value
+            if type(value) is ast.Name:
+                parts.append(value.id)
+                return '.'.join(reversed(parts))
+        
         try:
             return ast.unparse(node)
         except AttributeError:
@@ -244,40 +567,6 @@ class AnalysisEngine:
             else:
                 return "<expression>"
     
-    def _format_function_signature(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
-        """Format function signature."""
-        args = []
-        
-        # Regular arguments
-        for arg in node.args.args:
-            arg_str = arg.arg
-            if arg.annotation:
-                arg_str += f": {self._ast_to_string(arg.annotation)}"
-            args.append(arg_str)
-        
-        # *args
-        if node.args.vararg:
-            args.append(f"*{node.args.vararg.arg}")
-        
-        # **kwargs
-        if node.args.kwarg:
-            args.append(f"**{node.args.kwarg.arg}")
-        
-        prefix = "async " if isinstance(node, ast.AsyncFunctionDef) else ""
-        return f"{prefix}{node.name}({', '.join(args)})"
-    
-    def _estimate_complexity(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
-        """Estimate cyclomatic complexity (simplified)."""
-        complexity = 1  # Base complexity
-        
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.AsyncFor, ast.With, ast.AsyncWith)):
-                complexity += 1
-            elif isinstance(child, ast.ExceptHandler):
-                complexity += 1
-        
-        return complexity
-    
     def _check_ui_element(self, element_name: str, ui_elements: Dict[str, List[str]]) -> None:
         """Check if an element is a UI component."""
         for framework, widgets in self.ui_frameworks.items():
@@ -290,64 +579,66 @@ class AnalysisEngine:
     
     def _calculate_fingerprint(self, project_report: ProjectReport) -> str:
         """Calculate project fingerprint based on file paths and sizes."""
-        hasher = hashlib.sha256()
+        # Always BLAKE2b-256 so a project fingerprints the same in every environment
+        hasher = hashlib.blake2b(digest_size=32)
+        files = sorted(project_report.files, key=lambda f: f.path)
         
-        for file_info in sorted(project_report.files, key=lambda f: f.path):
-            content = f"{file_info.path}::{file_info.size_bytes}"
-            hasher.update(content.encode('utf-8'))
+        # Hash records in joined batches: one C call per batch instead of two per file.
+        # NUL cannot occur in paths, so it unambiguously ends each record's path.
+        for start in range(0, len(files), _FINGERPRINT_BATCH):
+            hasher.update(b''.join(
+                file_info.path.encode('utf-8') + b'\0' + file_info.size_bytes.to_bytes(8, 'little')
+                for file_info in files[start:start + _FINGERPRINT_BATCH]
+            ))
         
         return hasher.hexdigest()
     
     def _build_import_graph(self, file_analyses: List[FileAnalysis]) -> DependencyGraph:
         """Build import dependency graph."""
-        nodes = []
-        edges = []
+        # Nodes and edges are collected as parallel arrays; edges store node indexes
+        node_ids: List[str] = []
+        node_labels: List[str] = []
+        node_types: List[str] = []
+        node_index: Dict[str, int] = {}
+        edge_src = array('i')
+        edge_dst = array('i')
+        edge_types = array('b')
         
-        # Create nodes for all files and external dependencies
+        # Pass 1: internal module nodes (needed to validate internal import targets)
         file_modules = set()
-        external_modules = set()
+        source_indexes = []
         
         for analysis in file_analyses:
-            module_name = analysis.path.replace('/', '.').replace('.py', '')
+            module_name = analysis.module_name or self._module_name(analysis.path)
             file_modules.add(module_name)
-            nodes.append(GraphNode(
-                id=module_name,
-                label=Path(analysis.path).name,
-                type="internal_module"
-            ))
-            
-            # Collect external modules
-            external_modules.update(analysis.imports.external)
-        
-        # Add external module nodes
-        for ext_mod in external_modules:
-            if ext_mod:  # Skip empty strings
-                nodes.append(GraphNode(
-                    id=ext_mod,
-                    label=ext_mod,
-                    type="external_module"
-                ))
-        
-        # Create edges for imports
-        for analysis in file_analyses:
-            source_module = analysis.path.replace('/', '.').replace('.py', '')
-            
+            source_indexes.append(node_index.setdefault(module_name, len(node_ids)))
+            node_ids.append(module_name)
+            node_labels.append(Path(analysis.path).name)
+            node_types.append("internal_module")
+        
+        # Pass 2: edges, adding each external module node the first time it is imported
+        seen_external = set()
+        
+        for analysis, source in zip(file_analyses, source_indexes):
             # Internal imports
             for imp in analysis.imports.internal:
                 if imp and imp in file_modules:
-                    edges.append(GraphEdge(
-                        source=source_module,
-                        target=imp,
-                        type="internal_import"
-                    ))
+                    edge_src.append(source)
+                    edge_dst.append(node_index[imp])
+                    edge_types.append(_INTERNAL_EDGE)
             
             # External imports
             for imp in analysis.imports.external:
-                if imp:
-                    edges.append(GraphEdge(
-                        source=source_module,
-                        target=imp,
-                        type="external_import"
-                    ))
-        
-        return DependencyGraph(nodes=nodes, edges=edges)
\ No newline at end of file
+                if not imp:  # Skip empty strings
+                    continue
+                if imp not in seen_external:
+                    seen_external.add(imp)
+                    node_index.setdefault(imp, len(node_ids))
+                    node_ids.append(imp)
+                    node_labels.append(imp)
+                    node_types.append("external_module")
+                edge_src.append(source)
+                edge_dst.append(node_index[imp])
+                edge_types.append(_EXTERNAL_EDGE)
+        
+        return DependencyGraph.from_soa(node_ids, node_labels, node_types, edge_src, edge_dst, edge_types)
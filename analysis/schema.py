@@ -1,21 +1,24 @@
-"""Pydantic models for project analysis data."""
+"""Pydantic models for project analysis data (high-volume leaf records are slotted dataclasses)."""
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from pydantic import BaseModel, Field
 
 
-class ClassInfo(BaseModel):
+@dataclass(slots=True)
+class ClassInfo:
     """Information about a class definition."""
     name: str
-    bases: List[str] = Field(default_factory=list)
-    methods: List[str] = Field(default_factory=list)
+    bases: List[str] = field(default_factory=list)
+    methods: List[str] = field(default_factory=list)
     doc1: Optional[str] = None  # First line of docstring
     lineno: Optional[int] = None
 
 
-class FunctionInfo(BaseModel):
+@dataclass(slots=True)
+class FunctionInfo:
     """Information about a function definition."""
     name: str
     signature: str
@@ -24,29 +27,33 @@ class FunctionInfo(BaseModel):
     lineno: Optional[int] = None
 
 
-class UIInfo(BaseModel):
+@dataclass(slots=True)
+class UIInfo:
     """Information about UI elements in the file."""
-    windows: List[str] = Field(default_factory=list)
-    widgets: List[str] = Field(default_factory=list)
-    callbacks: List[str] = Field(default_factory=list)
+    windows: List[str] = field(default_factory=list)
+    widgets: List[str] = field(default_factory=list)
+    callbacks: List[str] = field(default_factory=list)
 
 
-class ComplexityInfo(BaseModel):
+@dataclass(slots=True)
+class ComplexityInfo:
     """Complexity metrics for a file."""
     cyclomatic: int = 0
     todo_count: int = 0
     hotspot: float = 0.0  # Risk/complexity score
 
 
-class ImportInfo(BaseModel):
+@dataclass(slots=True)
+class ImportInfo:
     """Import information for a file."""
-    internal: List[str] = Field(default_factory=list)
-    external: List[str] = Field(default_factory=list)
+    internal: List[str] = field(default_factory=list)
+    external: List[str] = field(default_factory=list)
 
 
 class FileAnalysis(BaseModel):
     """Analysis data for a single file."""
     path: str
+    module_name: Optional[str] = None  # Dotted module id used by the import graph
     language: str = "unknown"
     size_bytes: int = 0
     sloc: int = 0  # Source lines of code
@@ -69,29 +76,59 @@ class ProjectTotals(BaseModel):
 class ProjectInfo(BaseModel):
     """Project metadata."""
     name: str
-    fingerprint: str  # SHA256 hex
+    fingerprint: str  # BLAKE2b-256 hex
     root_rel: str = "."
     totals: ProjectTotals = Field(default_factory=ProjectTotals)
 
 
-class GraphNode(BaseModel):
+@dataclass(slots=True)
+class GraphNode:
     """Node in a dependency graph."""
     id: str
     label: str
     type: str = "module"
 
 
-class GraphEdge(BaseModel):
+@dataclass(slots=True)
+class GraphEdge:
     """Edge in a dependency graph."""
     source: str
     target: str
     type: str = "imports"
 
 
+# Edge type codes used by DependencyGraph.from_soa
+GRAPH_EDGE_TYPES = ("internal_import", "external_import")
+
+
 class DependencyGraph(BaseModel):
     """Dependency graph structure."""
     nodes: List[GraphNode] = Field(default_factory=list)
     edges: List[GraphEdge] = Field(default_factory=list)
+    
+    @classmethod
+    def from_soa(
+        cls,
+        node_ids: Sequence[str],
+        node_labels: Sequence[str],
+        node_types: Sequence[str],
+        edge_src: Sequence[int],
+        edge_dst: Sequence[int],
+        edge_types: Sequence[int],
+    ) -> "DependencyGraph":
+        """Build a graph from parallel node arrays and index-based edge arrays.
+        
+        Edges reference nodes by position; edge types are indexes into GRAPH_EDGE_TYPES.
+        """
+        nodes = [
+            GraphNode(id=node_id, label=label, type=node_type)
+            for node_id, label, node_type in zip(node_ids, node_labels, node_types)
+        ]
+        edges = [
+            GraphEdge(source=node_ids[src], target=node_ids[dst], type=GRAPH_EDGE_TYPES[kind])
+            for src, dst, kind in zip(edge_src, edge_dst, edge_types)
+        ]
+        return cls.model_construct(nodes=nodes, edges=edges)
 
 
 class ProjectGraphs(BaseModel):
@@ -4,14 +4,19 @@ from __future__ import annotations
 
 import argparse
 import json
+import multiprocessing
 import sys
 from pathlib import Path
 from typing import Dict, List
 
+try:
+    import orjson
+except ImportError:  # optional: faster bundle writing
+    orjson = None
+
 from analysis import AnalysisEngine
-from exporters import ExporterRegistry
+from exporters import ExporterRegistry, stream_to_path
 from report import ProjectReport
-from scan import scan_project
 
 
 def main() -> None:
@@ -104,6 +109,24 @@ Examples:
         help='Include test files in analysis'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Worker processes for file analysis (default: CPU count, 1 disables)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-analyze every file instead of reusing cached results'
+    )
+    
+    parser.add_argument(
+        '--imports-only',
+        action='store_true',
+        help='Only extract imports (fast dependency-graph runs)'
+    )
+    
     parser.add_argument(
         '--compact',
         action='store_true',
@@ -161,11 +184,16 @@ Examples:
             analysis_options['include_tests'] = args.include_tests
         if args.compact:
             analysis_options['compact'] = args.compact
+        if args.workers:
+            analysis_options['workers'] = args.workers
+        if args.no_cache:
+            analysis_options['cache'] = False
+        if args.imports_only:
+            analysis_options['imports_only'] = True
         
         # Scan and analyze
-        project_report = scan_project(project_path)
         engine = AnalysisEngine()
-        analysis = engine.analyze_project(project_report, analysis_options)
+        project_report, analysis = engine.scan_and_analyze(project_path, analysis_options)
         
         if args.verbose:
             print(f"Found {len(analysis.files)} files, {analysis.project.totals.sloc} SLOC")
@@ -258,15 +286,12 @@ def handle_single_export(analysis, project_report, args, verbose: bool) -> None:
     
     try:
         # Convert analysis to dict for compatibility
-        analysis_dict = analysis.model_dump() if hasattr(analysis, 'model_dump') else analysis.__dict__
+        analysis_dict = analysis.model_dump()
         
         # Prepare export options with project report for full-content exporters
         export_options = args.__dict__.copy()
         export_options['project_report'] = project_report
         
-        # Generate export
-        export_data = exporter.render(analysis_dict, export_options)
-        
         # Determine output path
         if args.output:
             output_path = Path(args.output)
@@ -274,13 +299,20 @@ def handle_single_export(analysis, project_report, args, verbose: bool) -> None:
             # Auto-generate filename
             output_path = Path(f"{analysis.project.name}_{args.format}.out")
         
-        # Write output
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        if isinstance(export_data, str):
-            output_path.write_text(export_data, encoding='utf-8')
+        if exporter.supports_streaming():
+            # Write straight to the file instead of holding the whole export in memory
+            stream_to_path(exporter, analysis_dict, export_options, output_path)
         else:
-            output_path.write_bytes(export_data)
+            # Generate export
+            export_data = exporter.render(analysis_dict, export_options)
+            
+            # Write output
+            if isinstance(export_data, str):
+                output_path.write_text(export_data, encoding='utf-8')
+            else:
+                output_path.write_bytes(export_data)
         
         if verbose:
             print(f"Exported to: {output_path}")
@@ -307,8 +339,11 @@ def handle_bundle(analysis, project_report, args, verbose: bool) -> None:
     if verbose:
         print(f"Bundling formats: {', '.join(format_ids)}")
     
+    # Convert analysis to dict once; the bundle reuses its project section
+    analysis_dict = analysis.model_dump()
+    
     bundle = {
-        'project': analysis.project.model_dump() if hasattr(analysis.project, 'model_dump') else analysis.project.__dict__,
+        'project': analysis_dict['project'],
         'exports': {},
         'metadata': {
             'bundle_version': '1.0',
@@ -317,9 +352,6 @@ def handle_bundle(analysis, project_report, args, verbose: bool) -> None:
         }
     }
     
-    # Convert analysis to dict for compatibility
-    analysis_dict = analysis.model_dump() if hasattr(analysis, 'model_dump') else analysis.__dict__
-    
     # Prepare export options with project report for full-content exporters
     export_options = args.__dict__.copy()
     export_options['project_report'] = project_report
@@ -358,7 +390,10 @@ def handle_bundle(analysis, project_report, args, verbose: bool) -> None:
     
     # Write bundle
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(bundle, indent=2), encoding='utf-8')
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(bundle, option=orjson.OPT_INDENT_2))
+    else:
+        output_path.write_text(json.dumps(bundle, indent=2), encoding='utf-8')
     
     if verbose:
         print(f"Bundle exported to: {output_path}")
@@ -369,4 +404,5 @@ def handle_bundle(analysis, project_report, args, verbose: bool) -> None:
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
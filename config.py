@@ -2,11 +2,21 @@
 """Configuration management for persistent user settings."""
 from __future__ import annotations
 
+import atexit
+import functools
 import json
+import os
+import sys
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict, field
 
+try:
+    import orjson
+except ImportError:  # optional: faster config writes
+    orjson = None
+
 from report import OutputFormat
 
 @dataclass
@@ -43,31 +53,42 @@ class AppConfig:
         filtered_data = {k: v for k, v in data.items() if k in known_fields}
         return cls(**filtered_data)
 
+# Seconds to wait for further update_* calls before writing the config file
+_FLUSH_DELAY = 0.25
+
+@functools.cache
+def _resolved_config_dir() -> Path:
+    """Get the appropriate config directory for the platform (resolved once)"""
+    if sys.platform == "win32":
+        # Windows: %APPDATA%
+        config_dir = Path(os.environ.get("APPDATA", "~")).expanduser()
+    elif sys.platform == "darwin":
+        # macOS: ~/Library/Application Support
+        config_dir = Path("~/Library/Application Support").expanduser()
+    else:
+        # Linux/Unix: ~/.config
+        config_dir = Path("~/.config").expanduser()
+    
+    app_config_dir = config_dir / "ProjectExportHelper"
+    app_config_dir.mkdir(parents=True, exist_ok=True)
+    return app_config_dir
+
 class ConfigManager:
     """Manages loading and saving application configuration"""
     
     def __init__(self, config_name: str = "project_export_helper.json"):
         self.config_path = self._get_config_dir() / config_name
         self._config: Optional[AppConfig] = None
+        self._dir_ready = False
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        # Pending coalesced writes must still reach disk on shutdown
+        atexit.register(self._flush)
     
     def _get_config_dir(self) -> Path:
         """Get the appropriate config directory for the platform"""
-        import os
-        import sys
-        
-        if sys.platform == "win32":
-            # Windows: %APPDATA%
-            config_dir = Path(os.environ.get("APPDATA", "~")).expanduser()
-        elif sys.platform == "darwin":
-            # macOS: ~/Library/Application Support
-            config_dir = Path("~/Library/Application Support").expanduser()
-        else:
-            # Linux/Unix: ~/.config
-            config_dir = Path("~/.config").expanduser()
-        
-        app_config_dir = config_dir / "ProjectExportHelper"
-        app_config_dir.mkdir(parents=True, exist_ok=True)
-        return app_config_dir
+        return _resolved_config_dir()
     
     def load_config(self) -> AppConfig:
         """Load configuration from disk, or create default if not found"""
@@ -75,13 +96,11 @@ class ConfigManager:
             return self._config
         
         try:
-            if self.config_path.exists():
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                self._config = AppConfig.from_dict(data)
-            else:
-                self._config = AppConfig()
-        except (json.JSONDecodeError, KeyError, TypeError, OSError):
+            # One read, parsed from the whole buffer; a missing file means defaults
+            raw = self.config_path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self._config = AppConfig.from_dict(data)
+        except (ValueError, KeyError, TypeError, OSError):
             # If config is corrupted or unreadable, use defaults
             self._config = AppConfig()
         
@@ -89,36 +108,70 @@ class ConfigManager:
     
     def save_config(self, config: AppConfig) -> None:
         """Save configuration to disk"""
-        self._config = config
+        with self._lock:
+            self._config = config
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._dirty = not self._write(config)
+    
+    def _schedule_flush(self) -> None:
+        """Mark the config dirty and write it once updates stop arriving"""
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(_FLUSH_DELAY, self._flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _flush(self) -> None:
+        """Write the config if a scheduled update is still pending"""
+        with self._lock:
+            if not self._dirty or self._config is None:
+                return
+            self._flush_timer = None
+            # A failed write stays pending for the next update or shutdown
+            self._dirty = not self._write(self._config)
+    
+    def _write(self, config: AppConfig) -> bool:
+        """Serialize config to disk (caller holds the lock); True on success"""
         try:
-            # Ensure directory exists
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
+            # Ensure directory exists (once per manager)
+            if not self._dir_ready:
+                self.config_path.parent.mkdir(parents=True, exist_ok=True)
+                self._dir_ready = True
             
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config.to_dict(), f, indent=2, ensure_ascii=False)
+            # Serialize up front so the file is written in a single call
+            if orjson is not None:
+                self.config_path.write_bytes(orjson.dumps(config.to_dict(), option=orjson.OPT_INDENT_2))
+            else:
+                text = json.dumps(config.to_dict(), indent=2, ensure_ascii=False)
+                self.config_path.write_text(text, encoding='utf-8')
+            return True
         except OSError:
             # Silently fail if we can't save - don't crash the app
-            pass
+            return False
+    
+    def _mutate(self, **changes: Any) -> None:
+        """Set fields on the cached config and schedule a coalesced write"""
+        config = self._config or self.load_config()
+        with self._lock:
+            for name, value in changes.items():
+                setattr(config, name, value)
+        self._schedule_flush()
     
     def update_source_folder(self, path: str) -> None:
         """Update the last used source folder"""
-        config = self.load_config()
-        config.last_source_folder = path
-        self.save_config(config)
+        self._mutate(last_source_folder=path)
     
     def update_save_folder(self, path: str) -> None:
         """Update the last used save folder and file"""
-        config = self.load_config()
-        config.last_save_folder = str(Path(path).parent)
-        config.last_save_file = str(path)
-        self.save_config(config)
+        self._mutate(last_save_folder=str(Path(path).parent), last_save_file=str(path))
     
     def update_export_options(self, format_value: str, include_contents: bool) -> None:
         """Update export format and content inclusion setting"""
-        config = self.load_config()
-        config.output_format = format_value
-        config.include_contents = include_contents
-        self.save_config(config)
+        self._mutate(output_format=format_value, include_contents=include_contents)
     
     def get_content_exclusions(self, root_path: str) -> list[str]:
         """Get stored excluded file paths for a given project root."""
@@ -127,12 +180,13 @@ class ConfigManager:
 
     def update_content_exclusions(self, root_path: str, exclusions: list[str]) -> None:
         """Persist excluded file paths for a project root."""
-        config = self.load_config()
+        # Replace rather than edit the dict: the flush timer may be serializing it
+        content_exclusions = dict(self.load_config().content_exclusions)
         if exclusions:
-            config.content_exclusions[root_path] = exclusions
+            content_exclusions[root_path] = list(exclusions)
         else:
-            config.content_exclusions.pop(root_path, None)
-        self.save_config(config)
+            content_exclusions.pop(root_path, None)
+        self._mutate(content_exclusions=content_exclusions)
     
     def get_deep_options(self) -> Dict[str, bool]:
         """Return stored deep analysis option overrides."""
@@ -141,25 +195,16 @@ class ConfigManager:
 
     def update_deep_options(self, options: Dict[str, bool]) -> None:
         """Persist deep analysis option overrides."""
-        config = self.load_config()
-        config.deep_options.update(options)
-        self.save_config(config)
+        deep_options = dict(self.load_config().deep_options)
+        deep_options.update(options)
+        self._mutate(deep_options=deep_options)
     
     def update_window_geometry(self, width: int, height: int, x: int, y: int) -> None:
         """Update window size and position"""
-        config = self.load_config()
-        config.window_width = width
-        config.window_height = height
-        config.window_x = x
-        config.window_y = y
-        self.save_config(config)
+        self._mutate(window_width=width, window_height=height, window_x=x, window_y=y)
 
 # Global config manager instance
-_config_manager: Optional[ConfigManager] = None
-
+@functools.cache
 def get_config_manager() -> ConfigManager:
     """Get the global config manager instance"""
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = ConfigManager()
-    return _config_manager
+    return ConfigManager()
@@ -6,12 +6,23 @@ import hashlib
 import json
 import mimetypes
 import os
+import pickle
 import re
+import sys
 from collections import defaultdict
-from dataclasses import dataclass, field, asdict, fields
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import partial
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Optional
 
+try:
+    import orjson
+except ImportError:  # optional: faster report serialization
+    orjson = None
+
+from config import get_config_manager
 from report import ProjectReport, FileInfo
 
 
@@ -32,6 +43,7 @@ class DeepAnalysisOptions:
     include_binary_manifest: bool = True
     include_llm_bundle: bool = True
     include_complexity_panel: bool = True
+    use_cache: bool = True
 
     @classmethod
     def from_dict(cls, data: dict[str, bool] | None) -> "DeepAnalysisOptions":
@@ -123,54 +135,97 @@ class DeepAnalysisReport:
     def to_json(self) -> str:
         """Return a machine-readable JSON string."""
 
-        return json.dumps(asdict(self), ensure_ascii=False, indent=2)
+        if orjson is not None:
+            try:
+                return orjson.dumps(self, option=orjson.OPT_INDENT_2).decode("utf-8")
+            except orjson.JSONEncodeError:
+                pass  # e.g. lone surrogates from source literals; let json handle them
+        return json.dumps(self, cls=_DataclassEncoder, ensure_ascii=False, indent=2)
+
+
+class _DataclassEncoder(json.JSONEncoder):
+    """Encode dataclasses field by field instead of deep-copying them via asdict."""
+
+    def default(self, o: object) -> object:
+        if is_dataclass(o) and not isinstance(o, type):
+            return {f.name: getattr(o, f.name) for f in fields(o)}
+        return super().default(o)
+
+
+# Load the platform MIME tables up front rather than on the first file analyzed
+if not mimetypes.inited:
+    mimetypes.init()
+
+# Shared decorator list for the common undecorated case; summaries never mutate it
+_NO_DECORATORS: list[str] = []
+
+# Nodes that raise the (approximate) complexity score
+_COMPLEXITY_NODES = (ast.If, ast.For, ast.While, ast.And, ast.Or, ast.Try, ast.BoolOp, ast.With)
 
 
 class PythonAnalyzer(ast.NodeVisitor):
     """Collect per-file information for Python sources."""
 
-    def __init__(self, module_path: str) -> None:
+    def __init__(self, module_path: str, source: str | None = None) -> None:
         self.module_path = module_path
+        # Sources that never mention __name__ cannot contain a main guard
+        self._maybe_has_main = source is None or "__name__" in source
         self.docstring = None
         self.functions: list[SignatureSummary] = []
         self.classes: list[SignatureSummary] = []
-        self.imports: set[str] = set()
-        self.call_targets: set[str] = set()
-        self.env_vars: set[str] = set()
-        self.config_keys: set[str] = set()
-        self.cli_commands: set[str] = set()
-        self.entrypoints: set[str] = set()
-        self.ui_widgets: set[str] = set()
-        self.tests: set[str] = set()
+        # Name collections are appended freely and de-duplicated once by the caller
+        self.imports: list[str] = []
+        self.call_targets: list[str] = []
+        self.env_vars: list[str] = []
+        self.config_keys: list[str] = []
+        self.cli_commands: list[str] = []
+        self.entrypoints: list[str] = []
+        self.ui_widgets: list[str] = []
+        self.tests: list[str] = []
         self.todo_locations: int = 0
+        self.complexity: int = 1
+        self.strings: set[str] = set()
         self._current_class: list[str] = []
+        self._name_cache: dict[int, str | None] = {}
+
+    def generic_visit(self, node: ast.AST) -> None:  # noqa: D401
+        # Every node passes through here, so complexity is tallied in the same walk
+        if isinstance(node, _COMPLEXITY_NODES):
+            self.complexity += 1
+        super().generic_visit(node)
+
+    def visit_Constant(self, node: ast.Constant) -> None:  # noqa: D401
+        if isinstance(node.value, str):
+            value = node.value.strip()
+            if 0 < len(value) <= 200 and "\n" not in value:
+                self.strings.add(value)
 
     def visit_Import(self, node: ast.Import) -> None:  # noqa: D401 - part of NodeVisitor
         for alias in node.names:
-            self.imports.add(alias.name)
+            self.imports.append(alias.name)
         self.generic_visit(node)
 
     def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # noqa: D401
         module = node.module or ""
         for alias in node.names:
             if module:
-                self.imports.add(f"{module}.{alias.name}")
+                self.imports.append(f"{module}.{alias.name}")
             else:
-                self.imports.add(alias.name)
+                self.imports.append(alias.name)
         self.generic_visit(node)
 
     def visit_Call(self, node: ast.Call) -> None:  # noqa: D401
         target = self._expr_to_name(node.func)
         if target:
-            self.call_targets.add(target)
+            self.call_targets.append(target)
             if target.endswith("ArgumentParser"):
-                self.cli_commands.add(target)
+                self.cli_commands.append(target)
             if target.endswith(("Tk", "CTk", "Frame", "Button", "Label")):
-                self.ui_widgets.add(target)
+                self.ui_widgets.append(target)
             if target.endswith(("getenv", "environ.get")) and node.args:
                 key = self._extract_string(node.args[0])
                 if key:
-                    self.env_vars.add(key)
+                    self.env_vars.append(key)
         self.visit_Call_keywords(node.keywords)
         self.generic_visit(node)
 
@@ -178,7 +233,7 @@ class PythonAnalyzer(ast.NodeVisitor):
         if isinstance(node.value, ast.Call):
             target = self._expr_to_name(node.value.func)
             if target and target.endswith("ArgumentParser"):
-                self.cli_commands.add(target)
+                self.cli_commands.append(target)
         self.generic_visit(node)
 
     def _process_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
@@ -190,19 +245,18 @@ class PythonAnalyzer(ast.NodeVisitor):
             name=qual,
             signature=signature,
             doc=_first_line(doc),
-            decorators=[self._expr_to_name(d) or "" for d in node.decorator_list if d],
+            decorators=self._decorator_names(node),
             lineno=node.lineno,
         )
         self.functions.append(summary)
 
         if qual.startswith("test_") or "/tests/" in self.module_path.replace("\\", "/"):
-            self.tests.add(qual)
+            self.tests.append(qual)
 
-        for stmt in node.body:
-            if isinstance(stmt, ast.If):
-                cond = ast.unparse(stmt.test) if hasattr(ast, "unparse") else None
-                if cond and "__name__" in cond and "__main__" in cond:
-                    self.entrypoints.add(qual)
+        if self._maybe_has_main:
+            for stmt in node.body:
+                if isinstance(stmt, ast.If) and _is_main_guard(stmt.test):
+                    self.entrypoints.append(qual)
 
         self.generic_visit(node)
 
@@ -221,22 +275,21 @@ class PythonAnalyzer(ast.NodeVisitor):
             name=qual,
             signature=signature,
             doc=_first_line(doc),
-            decorators=[self._expr_to_name(d) or "" for d in node.decorator_list if d],
+            decorators=self._decorator_names(node),
             lineno=node.lineno,
         )
         self.classes.append(summary)
 
         if any(base and "TestCase" in base for base in bases):
-            self.tests.add(qual)
+            self.tests.append(qual)
 
         self._current_class.append(node.name)
         self.generic_visit(node)
         self._current_class.pop()
 
     def visit_If(self, node: ast.If) -> None:  # noqa: D401
-        cond = ast.unparse(node.test) if hasattr(ast, "unparse") else None
-        if cond and "__name__" in cond and "__main__" in cond:
-            self.entrypoints.add(f"{self.module_path}::<module>")
+        if self._maybe_has_main and _is_main_guard(node.test):
+            self.entrypoints.append(f"{self.module_path}::<module>")
         self.generic_visit(node)
 
     def visit_Subscript(self, node: ast.Subscript) -> None:  # noqa: D401
@@ -244,7 +297,7 @@ class PythonAnalyzer(ast.NodeVisitor):
         if target in {"os.environ", "environ"}:
             key = self._extract_string(node.slice)
             if key:
-                self.env_vars.add(key)
+                self.env_vars.append(key)
         self.generic_visit(node)
 
     def visit_Call_keywords(self, keywords: Iterable[ast.keyword]) -> None:
@@ -252,27 +305,37 @@ class PythonAnalyzer(ast.NodeVisitor):
             if keyword.arg and "env" in keyword.arg.lower():
                 constant = self._extract_string(keyword.value)
                 if constant:
-                    self.env_vars.add(constant)
+                    self.env_vars.append(constant)
 
     def _qualname(self, name: str) -> str:
         if self._current_class:
             return ".".join(self._current_class + [name])
         return name
 
+    def _decorator_names(self, node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef) -> list[str]:
+        if not node.decorator_list:
+            return _NO_DECORATORS
+        # Decorators repeat heavily across a codebase; interning shares one string per name
+        return [sys.intern(self._expr_to_name(d) or ast.unparse(d)) for d in node.decorator_list if d]
+
     def _expr_to_name(self, expr: ast.AST | None) -> str | None:
         if expr is None:
             return None
+        # The tree outlives the analyzer, so node ids are stable cache keys
+        key = id(expr)
+        try:
+            return self._name_cache[key]
+        except KeyError:
+            pass
         if isinstance(expr, ast.Name):
-            return expr.id
-        if isinstance(expr, ast.Attribute):
+            name = expr.id
+        elif isinstance(expr, ast.Attribute):
             value = self._expr_to_name(expr.value)
-            return f"{value}.{expr.attr}" if value else expr.attr
-        if hasattr(ast, "unparse"):
-            try:
-                return ast.unparse(expr)
-            except Exception:  # pragma: no cover - defensive
-                return None
-        return None
+            name = f"{value}.{expr.attr}" if value else expr.attr
+        else:
+            name = None
+        self._name_cache[key] = name
+        return name
 
     def _extract_string(self, node: ast.AST | None) -> str | None:
         if node is None:
@@ -292,7 +355,9 @@ class PythonAnalyzer(ast.NodeVisitor):
         parts: list[str] = []
 
         def format_arg(arg: ast.arg) -> str:
-            annotation = self._expr_to_name(arg.annotation) if getattr(arg, "annotation", None) else None
+            annotation = arg.annotation
+            if annotation is not None:
+                annotation = self._expr_to_name(annotation) or ast.unparse(annotation)
             return f"{arg.arg}: {annotation}" if annotation else arg.arg
 
         for arg in getattr(args, "posonlyargs", []):
@@ -317,6 +382,15 @@ class PythonAnalyzer(ast.NodeVisitor):
         return f"{node.name}({', '.join(parts)})"
 
 
+def _is_main_guard(test: ast.AST) -> bool:
+    if not isinstance(test, ast.Compare):
+        return False
+    operands = [test.left, *test.comparators]
+    has_name = any(isinstance(op, ast.Name) and op.id == "__name__" for op in operands)
+    has_main = any(isinstance(op, ast.Constant) and op.value == "__main__" for op in operands)
+    return has_name and has_main
+
+
 def _first_line(text: str | None) -> str | None:
     if not text:
         return None
@@ -327,55 +401,102 @@ def _first_line(text: str | None) -> str | None:
 
 
 TODO_PATTERN = re.compile(r"\b(TODO|FIXME|XXX)\b", re.IGNORECASE)
+_CONFIG_KEY_PATTERN = re.compile(r"[\"']([A-Za-z0-9_.-]+)[\"']\s*[:=]")
+
+# Below this many files a process pool costs more than it saves
+_PARALLEL_MIN_FILES = 16
+
+# Bump when the per-file analysis changes so stale cached results are dropped
+_CACHE_VERSION = 1
+
+
+# Extension -> language label used in deep reports
+_EXT_LANG = {
+    ".py": "Python",
+    ".yml": "YAML",
+    ".yaml": "YAML",
+    ".json": "JSON",
+    ".md": "Markdown",
+    ".markdown": "Markdown",
+    ".ini": "Config",
+    ".cfg": "Config",
+    ".conf": "Config",
+    ".html": "HTML",
+    ".htm": "HTML",
+    ".css": "CSS",
+    ".js": "JavaScript/TypeScript",
+    ".ts": "JavaScript/TypeScript",
+    ".jpg": "Image",
+    ".jpeg": "Image",
+    ".png": "Image",
+    ".gif": "Image",
+    ".svg": "Image",
+    ".mp3": "Audio",
+    ".wav": "Audio",
+    ".flac": "Audio",
+    ".mp4": "Video",
+    ".mov": "Video",
+    ".avi": "Video",
+}
+
+# Languages whose contents are never read as text
+_BINARY_LANGS = frozenset({"Image", "Audio", "Video"})
 
 
 def _language_for_path(path: Path) -> str:
     ext = path.suffix.lower()
-    if ext == ".py":
-        return "Python"
-    if ext in {".yml", ".yaml"}:
-        return "YAML"
-    if ext in {".json"}:
-        return "JSON"
-    if ext in {".md", ".markdown"}:
-        return "Markdown"
-    if ext in {".ini", ".cfg", ".conf"}:
-        return "Config"
-    if ext in {".html", ".htm"}:
-        return "HTML"
-    if ext in {".css"}:
-        return "CSS"
-    if ext in {".js", ".ts"}:
-        return "JavaScript/TypeScript"
-    if ext in {".jpg", ".jpeg", ".png", ".gif", ".svg"}:
-        return "Image"
-    if ext in {".mp3", ".wav", ".flac"}:
-        return "Audio"
-    if ext in {".mp4", ".mov", ".avi"}:
-        return "Video"
-    return ext.lstrip(".") or "file"
-
-
-def _compute_sloc(contents: str) -> int:
-    return sum(1 for line in contents.splitlines() if line.strip())
+    return _EXT_LANG.get(ext) or ext.lstrip(".") or "file"
+
+
+# Lower-cased substrings that feed _responsibility_hint
+_RESPONSIBILITY_NEEDLES = ("tkinter", "argparse", "click", "model")
+
+
+def _scan_text(text: str) -> tuple[int, list[str], bool, set[str]]:
+    """Return SLOC, headings, licence-header flag and responsibility flags in one pass."""
+
+    sloc = 0
+    headings: list[str] = []
+    licence = False
+    flags: set[str] = set()
+    for index, line in enumerate(text.splitlines()):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        sloc += 1
+        if len(headings) < 10 and stripped.startswith("#"):
+            headings.append(line.strip("# "))
+        lower = line.lower()
+        if index < 20 and ("license" in lower or "copyright" in lower):
+            licence = True
+        for needle in _RESPONSIBILITY_NEEDLES:
+            if needle in lower:
+                flags.add(needle)
+        if "class" in line:
+            flags.add("class")
+            if "class " in line:
+                flags.add("class ")
+    return sloc, headings, licence, flags
 
 
 def _count_todos(contents: str) -> int:
     return len(TODO_PATTERN.findall(contents))
 
 
-def _compute_complexity(node: ast.AST) -> int:
-    class ComplexityVisitor(ast.NodeVisitor):
-        score = 1
+def _read_exact(path: Path, size: int) -> str:
+    # The scan already knows the size, so one read replaces open/fstat/chunked reads
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        data = os.read(fd, size)
+    finally:
+        os.close(fd)
+    return data.decode("utf-8", "ignore")
 
-        def generic_visit(self, node: ast.AST) -> None:  # noqa: D401
-            if isinstance(node, (ast.If, ast.For, ast.While, ast.And, ast.Or, ast.Try, ast.BoolOp, ast.With)):
-                self.score += 1
-            super().generic_visit(node)
 
-    visitor = ComplexityVisitor()
-    visitor.visit(node)
-    return visitor.score
+def _read_scannable(path: Path, size: int) -> str:
+    if size <= 0:
+        return path.read_text(encoding="utf-8", errors="ignore")
+    return _read_exact(path, size)
 
 
 def _risk_band(complexity: int, sloc: int, todo: int) -> tuple[str, float]:
@@ -387,33 +508,28 @@ def _risk_band(complexity: int, sloc: int, todo: int) -> tuple[str, float]:
     return "high", base
 
 
-def _responsibility_hint(path: Path, contents: str) -> str | None:
-    lower = contents.lower()
-    if "tkinter" in lower or "customtkinter" in lower:
+def _responsibility_hint(path: Path, flags: set[str]) -> str | None:
+    if "tkinter" in flags:
         return "GUI layer"
-    if "argparse" in lower or "click" in lower:
+    if "argparse" in flags or "click" in flags:
         return "CLI or entrypoint"
-    if "class " in contents and "test" in path.name.lower():
+    if "class " in flags and "test" in path.name.lower():
         return "Tests"
     if "config" in path.parts:
         return "Configuration"
-    if "model" in lower and "class" in contents:
+    if "model" in flags and "class" in flags:
         return "Domain model"
     return None
 
 
-def _detect_strings(node: ast.AST) -> set[str]:
-    strings: set[str] = set()
-
-    class StringsVisitor(ast.NodeVisitor):
-        def visit_Constant(self, constant: ast.Constant) -> None:  # noqa: D401
-            if isinstance(constant.value, str):
-                value = constant.value.strip()
-                if 0 < len(value) <= 200 and "\n" not in value:
-                    strings.add(value)
+@dataclass
+class _FileResult:
+    """Per-file output of _analyze_one, merged into the project report."""
 
-    StringsVisitor().visit(node)
-    return strings
+    file_card: DeepFileAnalysis
+    api_items: list[APIItem]
+    cli_items: list[dict[str, str]]
+    ui_items: list[dict[str, str]]
 
 
 def build_deep_analysis(
@@ -430,230 +546,72 @@ def build_deep_analysis(
     dependency_map: dict[str, list[str]] = {}
     call_graph: dict[str, list[str]] = {}
     cli_inventory: list[dict[str, str]] = []
-    config_schema: dict[str, list[str]] = defaultdict(list)
+    config_schema: dict[str, set[str]] = defaultdict(set)
     ui_catalogue: list[dict[str, str]] = []
-    test_map: dict[str, list[str]] = defaultdict(list)
-    string_catalogue: dict[str, list[str]] = defaultdict(list)
+    test_map: dict[str, set[str]] = defaultdict(set)
+    string_catalogue: dict[str, set[str]] = defaultdict(set)
     licence_findings: list[dict[str, str]] = []
     binary_manifest: list[dict[str, str]] = []
     llm_bundle: list[dict[str, object]] = []
 
     internal_modules = _derive_internal_modules(report.files)
+    worker = partial(
+        _analyze_one,
+        root_path=Path(root_path),
+        internal_modules=internal_modules,
+        options=options,
+    )
 
-    for info in report.files:
-        path = Path(root_path) / info.path
-        language = _language_for_path(path)
-        text: str | None = None
-        try:
-            if language.lower() not in {"image", "audio", "video"}:
-                text = path.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            text = None
-
-        sloc = _compute_sloc(text) if text else 0
-        todo_count = _count_todos(text) if text else 0
-        responsibility = _responsibility_hint(path, text or "")
-
-        constructs: dict[str, list[str]] = defaultdict(list)
-        functions: list[SignatureSummary] = []
-        classes: list[SignatureSummary] = []
-        imports: set[str] = set()
-        internal_imports: set[str] = set()
-        external_imports: set[str] = set()
-        call_targets: set[str] = set()
-        env_vars: set[str] = set()
-        config_keys: set[str] = set()
-        cli_commands: set[str] = set()
-        entrypoints: set[str] = set()
-        ui_widgets: set[str] = set()
-        tests: set[str] = set()
-        strings: set[str] = set()
-        licence: str | None = None
-        asset_meta: dict[str, str] | None = None
-        complexity_score: int | None = None
-
-        if path.suffix.lower() == ".py" and text is not None:
-            try:
-                module_ast = ast.parse(text)
-                module_doc = _first_line(ast.get_docstring(module_ast))
-                analyzer = PythonAnalyzer(info.path.replace(os.sep, "/"))
-                analyzer.visit(module_ast)
-
-                functions = analyzer.functions
-                classes = analyzer.classes
-                imports = analyzer.imports
-                call_targets = analyzer.call_targets
-                env_vars = analyzer.env_vars
-                cli_commands = analyzer.cli_commands
-                entrypoints = analyzer.entrypoints
-                ui_widgets = analyzer.ui_widgets
-                tests = analyzer.tests
-                strings = _detect_strings(module_ast)
-
-                if module_doc:
-                    constructs["docstring"] = [module_doc]
-
-                headings = [
-                    line.strip("# ")
-                    for line in text.splitlines()
-                    if line.strip().startswith("#")
-                ][:10]
-                if headings:
-                    constructs["sections"] = headings
-
-                if options.include_api_index:
-                    for summary in functions:
-                        api_index.append(
-                            APIItem(
-                                module=info.path,
-                                qualname=summary.name,
-                                signature=summary.signature,
-                                kind="function",
-                                doc=summary.doc,
-                            )
-                        )
-
-                    for summary in classes:
-                        api_index.append(
-                            APIItem(
-                                module=info.path,
-                                qualname=summary.name,
-                                signature=summary.signature,
-                                kind="class",
-                                doc=summary.doc,
-                            )
-                        )
-
-                if options.include_complexity_panel:
-                    complexity_score = _compute_complexity(module_ast)
-
-                # TODO counts already captured; tests map
-                if options.include_tests:
-                    for test in tests:
-                        test_map[info.path].append(test)
-
-                if options.include_ui_catalogue:
-                    for widget in ui_widgets:
-                        ui_catalogue.append({"file": info.path, "widget": widget})
-
-                if options.include_config_schema:
-                    for ev in env_vars:
-                        config_schema['environment'].append(ev)
-
-                if options.include_cli_inventory:
-                    for command in cli_commands:
-                        cli_inventory.append({"file": info.path, "command": command})
-
-                if options.include_string_catalogue:
-                    strings = {s for s in strings if len(s) < 160}
-                    for s in strings:
-                        string_catalogue[s].append(info.path)
-
-            except SyntaxError:
-                responsibility = responsibility or "Unparseable Python file"
-
-        elif text is not None:
-            if options.include_string_catalogue:
-                strings = {line.strip() for line in text.splitlines() if line.strip() and len(line.strip()) < 120}
-                for s in strings:
-                    string_catalogue[s].append(info.path)
-            else:
-                strings = set()
-
-        if options.include_config_schema and text and path.suffix.lower() in {".json", ".yaml", ".yml", ".toml", ".ini", ".cfg"}:
-            key_pattern = re.compile(r"[\"']([A-Za-z0-9_.-]+)[\"']\s*[:=]")
-            keys = sorted(set(key_pattern.findall(text)))
-            if keys:
-                config_keys.update(keys)
-                config_schema[path.suffix.lower()].extend(f"{info.path}:{key}" for key in keys)
-
-        if imports:
-            for item in imports:
-                namespace = item.split(".")[0]
-                if namespace in internal_modules:
-                    internal_imports.add(namespace)
-                else:
-                    external_imports.add(namespace)
+    for result in _cached_map_files(worker, report.files, Path(root_path), options, internal_modules):
+        file_card = result.file_card
+        files.append(file_card)
+        api_index.extend(result.api_items)
+        cli_inventory.extend(result.cli_items)
+        ui_catalogue.extend(result.ui_items)
+
+        # The file card already carries the option-filtered per-file values
+        if file_card.tests:
+            test_map[file_card.path].update(file_card.tests)
+        if options.include_config_schema and file_card.env_vars:
+            config_schema["environment"].update(file_card.env_vars)
+        if file_card.config_keys:
+            suffix = Path(file_card.path).suffix.lower()
+            config_schema[suffix].update(f"{file_card.path}:{key}" for key in file_card.config_keys)
+        for s in file_card.strings:
+            string_catalogue[s].add(file_card.path)
         if options.include_dependency_map:
-            dependency_map[info.path] = sorted({imp.split(".")[0] for imp in imports})
+            dependency_map[file_card.path] = sorted({imp.split(".")[0] for imp in file_card.imports})
         if options.include_call_graph:
-            call_graph[info.path] = sorted(call_targets)
-
-        if text:
-            top_lines = "\n".join(text.splitlines()[:20]).lower()
-            if "license" in top_lines or "copyright" in top_lines:
-                licence = "Possible licence header"
-
-        mimetype, _ = mimetypes.guess_type(path.name)
-        if options.include_binary_manifest and mimetype and not mimetype.startswith("text"):
-            asset_meta = {
-                "path": info.path,
-                "mime": mimetype,
-                "size": f"{info.size_bytes} bytes",
-            }
-            binary_manifest.append(asset_meta)
-
-        if complexity_score is not None:
-            risk, risk_score = _risk_band(complexity_score, sloc, todo_count)
-        else:
-            risk, risk_score = "not-computed", None
-
-        file_card = DeepFileAnalysis(
-            path=info.path,
-            language=language,
-            size_bytes=info.size_bytes,
-            mtime_iso=info.mtime_iso,
-            sloc=sloc,
-            todo_count=todo_count,
-            responsibility=responsibility,
-            constructs={k: v for k, v in constructs.items() if v},
-            functions=functions if options.include_functions else [],
-            classes=classes if options.include_classes else [],
-            imports=sorted(imports),
-            internal_imports=sorted(internal_imports),
-            external_imports=sorted(external_imports),
-            call_targets=sorted(call_targets),
-            env_vars=sorted(env_vars),
-            config_keys=sorted(config_keys) if options.include_config_schema else [],
-            cli_commands=sorted(cli_commands) if options.include_cli_inventory else [],
-            entrypoints=sorted(entrypoints),
-            ui_widgets=sorted(ui_widgets) if options.include_ui_catalogue else [],
-            tests=sorted(tests) if options.include_tests else [],
-            strings=sorted(strings) if options.include_string_catalogue else [],
-            licence=licence,
-            asset_meta=asset_meta,
-            cyclomatic_complexity=complexity_score,
-            complexity=risk,
-            risk_score=risk_score,
-        )
-        files.append(file_card)
+            call_graph[file_card.path] = file_card.call_targets
+        if file_card.asset_meta:
+            binary_manifest.append(file_card.asset_meta)
 
         if options.include_llm_bundle:
             llm_bundle.append(
                 {
-                    "path": info.path,
-                    "hash": hashlib.sha256(info.path.encode()).hexdigest()[:16],
-                    "language": language,
-                    "sloc": sloc,
-                    "todo_count": todo_count,
-                    "imports": sorted(imports),
-                    "complexity_band": risk if risk_score is not None else None,
-                    "cyclomatic_complexity": complexity_score,
-                    "functions": [summary.signature for summary in functions] if options.include_functions else [],
-                    "classes": [summary.signature for summary in classes] if options.include_classes else [],
+                    "path": file_card.path,
+                    "hash": hashlib.blake2b(file_card.path.encode("utf-8"), digest_size=8).hexdigest(),
+                    "language": file_card.language,
+                    "sloc": file_card.sloc,
+                    "todo_count": file_card.todo_count,
+                    "imports": file_card.imports,
+                    "complexity_band": file_card.complexity if file_card.risk_score is not None else None,
+                    "cyclomatic_complexity": file_card.cyclomatic_complexity,
+                    "functions": [summary.signature for summary in file_card.functions],
+                    "classes": [summary.signature for summary in file_card.classes],
                     "doc": file_card.constructs.get("docstring", [None])[0],
                 }
             )
 
-        if licence:
-            licence_findings.append({"file": info.path, "note": licence})
+        if file_card.licence:
+            licence_findings.append({"file": file_card.path, "note": file_card.licence})
 
     normalized_config_schema = (
-        {key: sorted(set(values)) for key, values in config_schema.items()} if options.include_config_schema else {}
+        {key: sorted(values) for key, values in config_schema.items()} if options.include_config_schema else {}
     )
     normalized_test_map = {key: sorted(values) for key, values in test_map.items()} if options.include_tests else {}
     normalized_string_catalogue = (
-        {key: sorted(set(values)) for key, values in string_catalogue.items()} if options.include_string_catalogue else {}
+        {key: sorted(values) for key, values in string_catalogue.items()} if options.include_string_catalogue else {}
     )
 
     return DeepAnalysisReport(
@@ -674,6 +632,253 @@ def build_deep_analysis(
     )
 
 
+def _analyze_one(
+    info: FileInfo,
+    root_path: Path,
+    internal_modules: set[str],
+    options: DeepAnalysisOptions,
+) -> _FileResult:
+    """Analyze a single file; runs in a worker process for larger projects."""
+
+    path = root_path / info.path
+    language = _language_for_path(path)
+    text: str | None = None
+    try:
+        if language not in _BINARY_LANGS:
+            text = _read_scannable(path, info.size_bytes)
+    except Exception:
+        text = None
+
+    if text:
+        sloc, headings, has_licence, flags = _scan_text(text)
+    else:
+        sloc, headings, has_licence, flags = 0, [], False, set()
+    todo_count = _count_todos(text) if text else 0
+    responsibility = _responsibility_hint(path, flags)
+
+    constructs: dict[str, list[str]] = defaultdict(list)
+    api_items: list[APIItem] = []
+    cli_items: list[dict[str, str]] = []
+    ui_items: list[dict[str, str]] = []
+    functions: list[SignatureSummary] = []
+    classes: list[SignatureSummary] = []
+    imports: set[str] = set()
+    internal_imports: set[str] = set()
+    external_imports: set[str] = set()
+    call_targets: set[str] = set()
+    env_vars: set[str] = set()
+    config_keys: set[str] = set()
+    cli_commands: set[str] = set()
+    entrypoints: set[str] = set()
+    ui_widgets: set[str] = set()
+    tests: set[str] = set()
+    strings: set[str] = set()
+    licence: str | None = None
+    asset_meta: dict[str, str] | None = None
+    complexity_score: int | None = None
+
+    if path.suffix.lower() == ".py" and text is not None:
+        try:
+            module_ast = ast.parse(text)
+            module_doc = _first_line(ast.get_docstring(module_ast))
+            analyzer = PythonAnalyzer(info.path.replace(os.sep, "/"), text)
+            analyzer.visit(module_ast)
+
+            functions = analyzer.functions
+            classes = analyzer.classes
+            imports = set(analyzer.imports)
+            call_targets = set(analyzer.call_targets)
+            env_vars = set(analyzer.env_vars)
+            cli_commands = set(analyzer.cli_commands)
+            entrypoints = set(analyzer.entrypoints)
+            ui_widgets = set(analyzer.ui_widgets)
+            tests = set(analyzer.tests)
+            strings = analyzer.strings
+
+            if module_doc:
+                constructs["docstring"] = [module_doc]
+
+            if headings:
+                constructs["sections"] = headings
+
+            if options.include_api_index:
+                for summary in functions:
+                    api_items.append(
+                        APIItem(
+                            module=info.path,
+                            qualname=summary.name,
+                            signature=summary.signature,
+                            kind="function",
+                            doc=summary.doc,
+                        )
+                    )
+
+                for summary in classes:
+                    api_items.append(
+                        APIItem(
+                            module=info.path,
+                            qualname=summary.name,
+                            signature=summary.signature,
+                            kind="class",
+                            doc=summary.doc,
+                        )
+                    )
+
+            if options.include_complexity_panel:
+                complexity_score = analyzer.complexity
+
+            if options.include_ui_catalogue:
+                for widget in ui_widgets:
+                    ui_items.append({"file": info.path, "widget": widget})
+
+            if options.include_cli_inventory:
+                for command in cli_commands:
+                    cli_items.append({"file": info.path, "command": command})
+
+            if options.include_string_catalogue:
+                strings = {s for s in strings if len(s) < 160}
+
+        except SyntaxError:
+            responsibility = responsibility or "Unparseable Python file"
+
+    elif text is not None:
+        if options.include_string_catalogue:
+            strings = {line.strip() for line in text.splitlines() if line.strip() and len(line.strip()) < 120}
+
+    if options.include_config_schema and text and path.suffix.lower() in {".json", ".yaml", ".yml", ".toml", ".ini", ".cfg"}:
+        keys = sorted(set(_CONFIG_KEY_PATTERN.findall(text)))
+        if keys:
+            config_keys.update(keys)
+
+    if imports:
+        for item in imports:
+            namespace = item.split(".")[0]
+            if namespace in internal_modules:
+                internal_imports.add(namespace)
+            else:
+                external_imports.add(namespace)
+
+    if has_licence:
+        licence = "Possible licence header"
+
+    if options.include_binary_manifest:
+        mimetype, _ = mimetypes.guess_type(path.name)
+        if mimetype and not mimetype.startswith("text"):
+            asset_meta = {
+                "path": info.path,
+                "mime": mimetype,
+                "size": f"{info.size_bytes} bytes",
+            }
+
+    if complexity_score is not None:
+        risk, risk_score = _risk_band(complexity_score, sloc, todo_count)
+    else:
+        risk, risk_score = "not-computed", None
+
+    file_card = DeepFileAnalysis(
+        path=info.path,
+        language=language,
+        size_bytes=info.size_bytes,
+        mtime_iso=info.mtime_iso,
+        sloc=sloc,
+        todo_count=todo_count,
+        responsibility=responsibility,
+        constructs={k: v for k, v in constructs.items() if v},
+        functions=functions if options.include_functions else [],
+        classes=classes if options.include_classes else [],
+        imports=sorted(imports),
+        internal_imports=sorted(internal_imports),
+        external_imports=sorted(external_imports),
+        call_targets=sorted(call_targets),
+        env_vars=sorted(env_vars),
+        config_keys=sorted(config_keys) if options.include_config_schema else [],
+        cli_commands=sorted(cli_commands) if options.include_cli_inventory else [],
+        entrypoints=sorted(entrypoints),
+        ui_widgets=sorted(ui_widgets) if options.include_ui_catalogue else [],
+        tests=sorted(tests) if options.include_tests else [],
+        strings=sorted(strings) if options.include_string_catalogue else [],
+        licence=licence,
+        asset_meta=asset_meta,
+        cyclomatic_complexity=complexity_score,
+        complexity=risk,
+        risk_score=risk_score,
+    )
+    return _FileResult(file_card, api_items, cli_items, ui_items)
+
+
+def _map_files(worker: Callable[[FileInfo], _FileResult], files: list[FileInfo]) -> list[_FileResult]:
+    """Run worker over files in input order, in parallel when it pays off."""
+
+    workers = os.cpu_count() or 1
+    if workers > 1 and len(files) >= _PARALLEL_MIN_FILES:
+        chunksize = max(1, len(files) // (4 * workers))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(worker, files, chunksize=chunksize))
+        except (OSError, BrokenProcessPool):
+            # Process pools can be unavailable (sandboxes, frozen apps); stay serial
+            pass
+    return [worker(info) for info in files]
+
+
+def _cached_map_files(
+    worker: Callable[[FileInfo], _FileResult],
+    files: list[FileInfo],
+    root_path: Path,
+    options: DeepAnalysisOptions,
+    internal_modules: set[str],
+) -> list[_FileResult]:
+    """Like _map_files, but reuse results for files whose size and mtime are unchanged."""
+
+    if not options.use_cache:
+        return _map_files(worker, files)
+
+    cache_path = _cache_path(root_path)
+    # Import classification depends on the project's module set, so it is part of the key
+    signature = (_CACHE_VERSION, options, frozenset(internal_modules))
+    cached = _load_cache(cache_path, signature)
+
+    keys = [(info.path, info.size_bytes, info.mtime_ns) for info in files]
+    misses = [info for info, key in zip(files, keys) if not info.mtime_ns or key not in cached]
+    fresh = iter(_map_files(worker, misses))
+
+    results: list[_FileResult] = []
+    entries: dict[tuple[str, int, int], _FileResult] = {}
+    for info, key in zip(files, keys):
+        result = cached.get(key) if info.mtime_ns else None
+        if result is None:
+            result = next(fresh)
+        if info.mtime_ns:
+            entries[key] = result
+        results.append(result)
+
+    if misses or len(entries) != len(cached):
+        _save_cache(cache_path, signature, entries)
+    return results
+
+
+def _cache_path(root_path: Path) -> Path:
+    digest = hashlib.blake2b(str(root_path.resolve()).encode("utf-8"), digest_size=16).hexdigest()
+    return get_config_manager().config_path.parent / "deep_cache" / f"{digest}.pkl"
+
+
+def _load_cache(cache_path: Path, signature: tuple) -> dict[tuple[str, int, int], _FileResult]:
+    try:
+        stored_signature, entries = pickle.loads(cache_path.read_bytes())
+    except Exception:
+        # Missing, truncated or incompatible caches just mean a full run
+        return {}
+    return entries if stored_signature == signature else {}
+
+
+def _save_cache(cache_path: Path, signature: tuple, entries: dict[tuple[str, int, int], _FileResult]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(pickle.dumps((signature, entries), protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+
+
 def _derive_internal_modules(files: list[FileInfo]) -> set[str]:
     modules = set()
     for fi in files:
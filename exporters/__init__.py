@@ -1,22 +1,39 @@
 """Exporters package initialization and registry."""
 from __future__ import annotations
 
-from .base import ExporterRegistry, Exporter, register_exporter
+import importlib
+from typing import Any
 
-# Import all exporters to ensure they're registered
-from .llm_tds import LLMTDSExporter
-from .basic_json import BasicJSONExporter
-from .basic_markdown import BasicMarkdownExporter
-from .full_content_json import FullContentJSONExporter
-from .full_content_markdown import FullContentMarkdownExporter
-from .legacy_html import LegacyHTMLExporter
-from .lrc_capsule import LRCCapsuleExporter
+from .base import ExporterRegistry, Exporter, register_exporter, stream_to_path
+
+# Built-in formats and the submodule that registers each one; imported on first use
+_FORMAT_MODULES = {
+    'llm-tds': '.llm_tds',
+    'basic-json': '.basic_json',
+    'basic-markdown': '.basic_markdown',
+    'full-content-json': '.full_content_json',
+    'full-content-markdown': '.full_content_markdown',
+    'legacy-html': '.legacy_html',
+    'lrc-capsule': '.lrc_capsule',
+}
+
+# Exporter classes re-exported from this package, resolved lazily via __getattr__
+_CLASS_MODULES = {
+    'LLMTDSExporter': '.llm_tds',
+    'BasicJSONExporter': '.basic_json',
+    'BasicMarkdownExporter': '.basic_markdown',
+    'FullContentJSONExporter': '.full_content_json',
+    'FullContentMarkdownExporter': '.full_content_markdown',
+    'LegacyHTMLExporter': '.legacy_html',
+    'LRCCapsuleExporter': '.lrc_capsule',
+}
 
 # Export main classes and functions
 __all__ = [
     'ExporterRegistry',
     'Exporter', 
     'register_exporter',
+    'stream_to_path',
     'LLMTDSExporter',
     'BasicJSONExporter',
     'BasicMarkdownExporter',
@@ -27,24 +44,48 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Import exporter classes on first attribute access (PEP 562)."""
+    module_name = _CLASS_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
+
+
+def _load_all() -> None:
+    """Import every built-in exporter so the registry is complete."""
+    for module_name in _FORMAT_MODULES.values():
+        importlib.import_module(module_name, __name__)
+
+
+def _load_format(format_name: str) -> bool:
+    """Import the built-in exporter for one format; False if it is not built in."""
+    module_name = _FORMAT_MODULES.get(format_name)
+    if module_name is None:
+        return False
+    importlib.import_module(module_name, __name__)
+    return True
+
+
 def get_exporter(format_name: str) -> Exporter | None:
     """Get an exporter instance by format name."""
-    exporter_class = ExporterRegistry.get(format_name)
-    if exporter_class:
-        return exporter_class()
-    return None
+    return ExporterRegistry.get_instance(format_name)
 
 
 def list_available_formats() -> list[str]:
     """List all available export formats."""
-    return ExporterRegistry.list_formats()
+    # Registry snapshot only: listing must not import the built-in modules
+    extra = [name for name in list(ExporterRegistry._exporters) if name not in _FORMAT_MODULES]
+    return list(_FORMAT_MODULES) + extra
 
 
 def get_llm_formats() -> list[str]:
     """Get formats optimized for LLM consumption."""
-    return ExporterRegistry.get_llm_formats()
+    llm = set(ExporterRegistry.get_llm_formats())
+    return [name for name in list_available_formats() if name in llm]
 
 
 def get_lossless_formats() -> list[str]:
     """Get lossless formats."""
-    return ExporterRegistry.get_lossless_formats()
+    lossless = set(ExporterRegistry.get_lossless_formats())
+    return [name for name in list_available_formats() if name in lossless]
@@ -1,8 +1,11 @@
 """Base exporter interface and registry."""
 from __future__ import annotations
 
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Type
+from pathlib import Path
+from typing import Any, Dict, Set, Type
 
 
 class Exporter(ABC):
@@ -39,50 +42,114 @@ class Exporter(ABC):
 
         return None
 
+    def supports_streaming(self) -> bool:
+        """Whether render() can write to a binary ``options['output_stream']``."""
+
+        return False
+
 
 class ExporterRegistry:
     """Registry for available exporters."""
     
     _exporters: Dict[str, Type[Exporter]] = {}
+    # Exporters are stateless, so one shared instance per format is enough
+    _instances: Dict[str, Exporter] = {}
+    # Capability indexes, filled at registration (dicts keep registration order)
+    _llm: Dict[str, None] = {}
+    _lossless: Dict[str, None] = {}
+    # Classes already registered; guarded by _lock so concurrent first imports
+    # instantiate each exporter once (lookups stay lock-free)
+    _registered: Set[Type[Exporter]] = set()
+    _lock = threading.Lock()
+    # Set (under _lock) once every built-in exporter module has been imported
+    _builtins_loaded = False
+    
+    @classmethod
+    def _ensure_builtins(cls, name: str | None = None) -> None:
+        """Import the built-in exporter module for ``name``, or all of them."""
+        if cls._builtins_loaded:
+            return
+        # Deferred: the package imports this module, and loads submodules lazily
+        from . import _load_all, _load_format
+        if name is not None and _load_format(name):
+            return
+        # Imports are idempotent and wait for concurrent ones to finish, so the
+        # flag is only published once everything is registered; a failed
+        # import leaves it unset and is retried on the next call
+        _load_all()
+        with cls._lock:
+            cls._builtins_loaded = True
     
     @classmethod
     def register(cls, exporter_class: Type[Exporter]) -> None:
         """Register an exporter by its name."""
-        instance = exporter_class()
-        cls._exporters[instance.name] = exporter_class
+        with cls._lock:
+            if exporter_class in cls._registered:
+                return
+            instance = exporter_class()
+            cls._exporters[instance.name] = exporter_class
+            cls._instances[instance.name] = instance
+            cls._llm.pop(instance.name, None)
+            cls._lossless.pop(instance.name, None)
+            if instance.is_llm_friendly():
+                cls._llm[instance.name] = None
+            if instance.is_lossless():
+                cls._lossless[instance.name] = None
+            cls._registered.add(exporter_class)
     
     @classmethod
     def get(cls, name: str) -> Type[Exporter] | None:
         """Get an exporter class by name."""
+        if name not in cls._exporters:
+            cls._ensure_builtins(name)
         return cls._exporters.get(name)
     
+    @classmethod
+    def get_instance(cls, name: str) -> Exporter | None:
+        """Get the shared exporter instance by name."""
+        if name not in cls._instances:
+            cls._ensure_builtins(name)
+        return cls._instances.get(name)
+    
     @classmethod
     def list_formats(cls) -> list[str]:
         """List all available format names."""
+        cls._ensure_builtins()
         return list(cls._exporters.keys())
     
     @classmethod
     def get_llm_formats(cls) -> list[str]:
         """List LLM-friendly formats."""
-        formats = []
-        for name, exporter_class in cls._exporters.items():
-            instance = exporter_class()
-            if instance.is_llm_friendly():
-                formats.append(name)
-        return formats
+        cls._ensure_builtins()
+        return list(cls._llm)
     
     @classmethod
     def get_lossless_formats(cls) -> list[str]:
         """List lossless formats."""
-        formats = []
-        for name, exporter_class in cls._exporters.items():
-            instance = exporter_class()
-            if instance.is_lossless():
-                formats.append(name)
-        return formats
+        cls._ensure_builtins()
+        return list(cls._lossless)
 
 
 def register_exporter(exporter_class: Type[Exporter]) -> Type[Exporter]:
     """Decorator to register an exporter."""
     ExporterRegistry.register(exporter_class)
     return exporter_class
+
+
+def stream_to_path(exporter: Exporter, analysis: Dict[str, Any], options: Dict[str, Any], path: Path) -> None:
+    """Stream a render into ``path`` through a temporary file in the same directory.
+
+    The destination is only replaced once render() succeeds, so a failed
+    export leaves any existing file untouched.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp_path.open('xb') as stream:
+            exporter.render(analysis, {**options, 'output_stream': stream})
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
@@ -4,6 +4,11 @@ from __future__ import annotations
 import json
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding
+    orjson = None
+
 from .base import Exporter, register_exporter
 from analysis.schema import ProjectAnalysis
 
@@ -16,12 +21,14 @@ class BasicJSONExporter(Exporter):
     def name(self) -> str:
         return "basic-json"
     
-    def render(self, analysis: Dict[str, Any], options: Dict[str, Any]) -> str:
+    def render(self, analysis: ProjectAnalysis | Dict[str, Any], options: Dict[str, Any]) -> bytes | str:
         """Render analysis as clean JSON."""
-        project_analysis = ProjectAnalysis(**analysis)
-        
-        # Convert to dictionary and ensure proper serialization
-        result = project_analysis.dict()
+        # Callers pass an already-dumped model, so a shallow copy is enough; only
+        # a live model needs converting
+        if isinstance(analysis, ProjectAnalysis):
+            result = analysis.model_dump()
+        else:
+            result = dict(analysis)
         
         # Add format metadata
         result["format"] = "basic-json"
@@ -32,15 +39,24 @@ class BasicJSONExporter(Exporter):
         project_report = options.get('project_report')
         
         if include_content and project_report:
-            # Create a mapping of file paths to content
-            content_map = {f.path: f.content for f in project_report.files if f.content is not None}
+            # Index the report by path once; analysis files may be filtered or
+            # reordered, so the two lists cannot simply be zipped
+            content_by_path = {f.path: f.content for f in project_report.files}
+            get_content = content_by_path.get
             
-            # Add content to file analyses
+            # Add content to copies of the file analyses (the input is shared across exports)
+            files = []
             for file_analysis in result.get('files', []):
-                file_path = file_analysis.get('path')
-                if file_path in content_map:
-                    file_analysis['content'] = content_map[file_path]
+                content = get_content(file_analysis.get('path'))
+                if content is not None:
+                    file_analysis = {**file_analysis, 'content': content}
+                files.append(file_analysis)
+            result['files'] = files
         
+        if orjson is not None:
+            # Datetimes pass through to default=str so output matches the json fallback
+            options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            return orjson.dumps(result, option=options, default=str)
         return json.dumps(result, indent=2, ensure_ascii=False, default=str)
     
     def mimetype(self) -> str:
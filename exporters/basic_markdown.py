@@ -1,12 +1,25 @@
 """Basic Markdown exporter for human-readable documentation."""
 from __future__ import annotations
 
+import functools
+import io
 from typing import Any, Dict
 
 from .base import Exporter, register_exporter
 from analysis.schema import ProjectAnalysis
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_size(size_bytes: int) -> str:
+    """Format file size in human-readable format."""
+    size = float(size_bytes)
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
 @register_exporter
 class BasicMarkdownExporter(Exporter):
     """Human-readable Markdown format."""
@@ -15,9 +28,13 @@ class BasicMarkdownExporter(Exporter):
     def name(self) -> str:
         return "basic-markdown"
     
-    def render(self, analysis: Dict[str, Any], options: Dict[str, Any]) -> str:
+    def render(self, analysis: ProjectAnalysis | Dict[str, Any], options: Dict[str, Any]) -> str:
         """Render analysis as Markdown documentation."""
-        project_analysis = ProjectAnalysis(**analysis)
+        # Attribute access needs nested models, so plain dicts still go through validation
+        if isinstance(analysis, ProjectAnalysis):
+            project_analysis = analysis
+        else:
+            project_analysis = ProjectAnalysis.model_validate(analysis)
         
         # Check if content should be included
         include_content = options.get('include_content', False)
@@ -26,127 +43,112 @@ class BasicMarkdownExporter(Exporter):
         
         if include_content and project_report:
             # Create a mapping of file paths to content
-            content_map = {f.path: f.content for f in project_report.files if f.content is not None}
+            content_map = {f.path: f.content for f in project_report.files}
         
-        lines = []
+        buf = io.StringIO()
+        w = buf.write
+        writelines = buf.writelines
         
         # Header
-        lines.append(f"# {project_analysis.project.name}")
-        lines.append("")
-        lines.append(f"**Generated:** {project_analysis.generated_at.strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"**Root:** {project_analysis.project.root_rel}")
+        w(f"# {project_analysis.project.name}\n\n")
+        w(f"**Generated:** {project_analysis.generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        w(f"**Root:** {project_analysis.project.root_rel}\n")
         if include_content:
-            lines.append(f"**Content:** Included")
-        lines.append("")
+            w("**Content:** Included\n")
+        w("\n")
         
         # Summary
         totals = project_analysis.project.totals
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- **Files:** {totals.files:,}")
-        lines.append(f"- **Lines of Code:** {totals.sloc:,}")
-        lines.append(f"- **Total Size:** {self._format_size(totals.size_bytes)}")
-        lines.append("")
+        w("## Summary\n\n")
+        w(f"- **Files:** {totals.files:,}\n")
+        w(f"- **Lines of Code:** {totals.sloc:,}\n")
+        w(f"- **Total Size:** {_format_size(totals.size_bytes)}\n\n")
         
-        # File listing
-        lines.append("## Files")
-        lines.append("")
+        # File listing (each section opens with its blank separator line)
+        w("## Files\n")
         
         for file_info in sorted(project_analysis.files, key=lambda f: f.path):
-            lines.append(f"### 📄 {file_info.path}")
-            lines.append("")
+            w(f"\n### 📄 {file_info.path}\n\n")
             
             # Basic info
-            lines.append(f"- **Language:** {file_info.language}")
-            lines.append(f"- **Size:** {self._format_size(file_info.size_bytes)}")
-            lines.append(f"- **Lines:** {file_info.sloc}")
+            w(f"- **Language:** {file_info.language}\n")
+            w(f"- **Size:** {_format_size(file_info.size_bytes)}\n")
+            w(f"- **Lines:** {file_info.sloc}\n")
             
             if file_info.responsibility:
-                lines.append(f"- **Purpose:** {file_info.responsibility}")
+                w(f"- **Purpose:** {file_info.responsibility}\n")
             
-            lines.append("")
+            w("\n")
             
             # Imports
             if file_info.imports.internal or file_info.imports.external:
-                lines.append("**Imports:**")
-                lines.append("")
+                w("**Imports:**\n\n")
                 
                 if file_info.imports.internal:
-                    lines.append("*Internal:*")
-                    for imp in sorted(file_info.imports.internal):
-                        lines.append(f"- `{imp}`")
-                    lines.append("")
+                    w("*Internal:*\n")
+                    writelines(f"- `{imp}`\n" for imp in sorted(file_info.imports.internal))
+                    w("\n")
                 
                 if file_info.imports.external:
-                    lines.append("*External:*")
-                    for imp in sorted(file_info.imports.external):
-                        lines.append(f"- `{imp}`")
-                    lines.append("")
+                    w("*External:*\n")
+                    writelines(f"- `{imp}`\n" for imp in sorted(file_info.imports.external))
+                    w("\n")
             
             # Classes
             if file_info.classes:
-                lines.append("**Classes:**")
-                lines.append("")
-                lines.append("| Class | Bases | Methods | Description |")
-                lines.append("|-------|-------|---------|-------------|")
+                w("**Classes:**\n\n")
+                w("| Class | Bases | Methods | Description |\n")
+                w("|-------|-------|---------|-------------|\n")
                 
-                for cls in file_info.classes:
-                    bases = ", ".join(cls.bases) if cls.bases else "—"
-                    methods = f"{len(cls.methods)} methods" if cls.methods else "No methods"
-                    doc = cls.doc1 or "—"
-                    lines.append(f"| `{cls.name}` | `{bases}` | {methods} | {doc} |")
+                writelines(
+                    f"| `{cls.name}` | `{', '.join(cls.bases) if cls.bases else '—'}` | "
+                    f"{f'{len(cls.methods)} methods' if cls.methods else 'No methods'} | {cls.doc1 or '—'} |\n"
+                    for cls in file_info.classes
+                )
                 
-                lines.append("")
+                w("\n")
             
             # Functions
             if file_info.functions:
-                lines.append("**Functions:**")
-                lines.append("")
-                lines.append("| Function | Returns | Description |")
-                lines.append("|----------|---------|-------------|")
+                w("**Functions:**\n\n")
+                w("| Function | Returns | Description |\n")
+                w("|----------|---------|-------------|\n")
                 
-                for func in file_info.functions:
-                    returns = func.returns or "—"
-                    doc = func.doc1 or "—"
-                    lines.append(f"| `{func.signature}` | `{returns}` | {doc} |")
+                writelines(
+                    f"| `{func.signature}` | `{func.returns or '—'}` | {func.doc1 or '—'} |\n"
+                    for func in file_info.functions
+                )
                 
-                lines.append("")
+                w("\n")
             
             # Tests
             if file_info.tests:
-                lines.append("**Tests:**")
-                lines.append("")
-                for test in file_info.tests:
-                    lines.append(f"- `{test}`")
-                lines.append("")
+                w("**Tests:**\n\n")
+                writelines(f"- `{test}`\n" for test in file_info.tests)
+                w("\n")
             
             # Complexity
             if file_info.complexity.todo_count > 0 or file_info.complexity.cyclomatic > 0:
-                lines.append("**Complexity:**")
-                lines.append("")
+                w("**Complexity:**\n\n")
                 if file_info.complexity.cyclomatic > 0:
-                    lines.append(f"- Cyclomatic complexity: {file_info.complexity.cyclomatic}")
+                    w(f"- Cyclomatic complexity: {file_info.complexity.cyclomatic}\n")
                 if file_info.complexity.todo_count > 0:
-                    lines.append(f"- TODO items: {file_info.complexity.todo_count}")
+                    w(f"- TODO items: {file_info.complexity.todo_count}\n")
                 if file_info.complexity.hotspot > 0:
-                    lines.append(f"- Hotspot score: {file_info.complexity.hotspot:.2f}")
-                lines.append("")
+                    w(f"- Hotspot score: {file_info.complexity.hotspot:.2f}\n")
+                w("\n")
             
             # File content (if requested and available)
-            if include_content and file_info.path in content_map:
-                content = content_map[file_info.path]
+            if include_content:
+                content = content_map.get(file_info.path)
                 if content and content.strip():
-                    lines.append("**Content:**")
-                    lines.append("")
-                    lines.append("```" + file_info.language)
-                    lines.append(content)
-                    lines.append("```")
-                    lines.append("")
+                    w(f"**Content:**\n\n```{file_info.language}\n")
+                    w(content)
+                    w("\n```\n\n")
             
-            lines.append("---")
-            lines.append("")
+            w("---\n")
         
-        return "\n".join(lines)
+        return buf.getvalue()
     
     def mimetype(self) -> str:
         return "text/markdown"
@@ -155,13 +157,4 @@ class BasicMarkdownExporter(Exporter):
         return True  # For the analysis data
     
     def is_llm_friendly(self) -> bool:
-        return True  # Markdown is LLM-readable
-    
-    def _format_size(self, size_bytes: int) -> str:
-        """Format file size in human-readable format."""
-        size = float(size_bytes)
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
\ No newline at end of file
+        return True  # Markdown is LLM-readable
\ No newline at end of file
@@ -2,11 +2,60 @@
 from __future__ import annotations
 
 import json
+import os
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding
+    orjson = None
+
 from .base import Exporter, register_exporter
 from analysis.schema import ProjectAnalysis
 
+# Language name by lower-cased file extension
+_LANGUAGE_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.html': 'html',
+    '.css': 'css',
+    '.md': 'markdown',
+    '.json': 'json',
+    '.yml': 'yaml',
+    '.yaml': 'yaml',
+    '.xml': 'xml',
+    '.txt': 'text',
+    '.sh': 'bash',
+    '.sql': 'sql',
+    '.java': 'java',
+    '.cpp': 'cpp',
+    '.c': 'c',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.php': 'php',
+    '.rb': 'ruby'
+}
+_LANGUAGE_GET = _LANGUAGE_MAP.get
+
+
+def _detect_language(filepath: str) -> str:
+    """Detect programming language from file extension."""
+    return _LANGUAGE_GET(os.path.splitext(filepath)[1].lower(), 'text')
+
+
+# How an empty "files" array closes the indented document
+_EMPTY_FILES_TAIL = b'[]\n}'
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode obj as indented UTF-8 JSON."""
+    if orjson is not None:
+        # Datetimes pass through to default=str so output matches the json fallback
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(obj, option=options, default=str)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
 
 @register_exporter
 class FullContentJSONExporter(Exporter):
@@ -16,13 +65,28 @@ class FullContentJSONExporter(Exporter):
     def name(self) -> str:
         return "full-content-json"
     
-    def render(self, analysis: Dict[str, Any], options: Dict[str, Any]) -> str:
-        """Render analysis with full file content as JSON."""
+    def render(self, analysis: Dict[str, Any], options: Dict[str, Any]) -> bytes | str:
+        """Render analysis with full file content as JSON.
+        
+        When ``options['output_stream']`` is a binary file object the document
+        is written to it one file entry at a time and ``b""`` is returned.
+        """
         # Get the raw project report from options if available
         project_report = options.get('project_report')
         if not project_report:
             raise ValueError("full-content-json exporter requires project_report in options")
         
+        # Summary statistics (one pass, no content work)
+        text_files = total_size = total_lines = total_words = 0
+        for file_info in project_report.files:
+            total_size += file_info.size_bytes
+            if isinstance(file_info.lines, int):
+                total_lines += file_info.lines
+            if isinstance(file_info.words, int):
+                total_words += file_info.words
+            if file_info.content is not None:
+                text_files += 1
+        
         # Create enhanced data structure with full content
         result = {
             "format": "full-content-json",
@@ -35,35 +99,56 @@ class FullContentJSONExporter(Exporter):
             },
             "summary": {
                 "total_files": len(project_report.files),
-                "text_files": sum(1 for f in project_report.files if f.content is not None),
-                "total_size_bytes": sum(f.size_bytes for f in project_report.files),
-                "total_lines": sum(f.lines if isinstance(f.lines, int) else 0 for f in project_report.files),
-                "total_words": sum(f.words if isinstance(f.words, int) else 0 for f in project_report.files)
+                "text_files": text_files,
+                "total_size_bytes": total_size,
+                "total_lines": total_lines,
+                "total_words": total_words
             },
             "files": []
         }
         
-        # Add all files with full content
+        stream = options.get('output_stream')
+        if stream is None:
+            result["files"] = [self._file_entry(fi) for fi in project_report.files]
+            return _dumps(result)
+        
+        # Stream: everything up to the files array, then one entry at a time,
+        # re-indented to sit inside the array exactly as the one-shot dump does
+        head = _dumps(result)
+        if not project_report.files:
+            stream.write(head)
+            return b""
+        stream.write(head[:-len(_EMPTY_FILES_TAIL)])
+        stream.write(b"[")
+        sep = b"\n    "
         for file_info in project_report.files:
-            file_data = {
-                "path": file_info.path,
-                "size_bytes": file_info.size_bytes,
-                "lines": file_info.lines,
-                "words": file_info.words,
-                "mtime_iso": file_info.mtime_iso,
-                "language": self._detect_language(file_info.path),
-                "content": file_info.content,  # Full source code content
-                "has_content": file_info.content is not None
-            }
-            
-            # Add enhanced metadata
-            if file_info.content:
-                file_data["content_preview"] = self._get_content_preview(file_info.content)
-                file_data["encoding"] = "utf-8"
-                
-            result["files"].append(file_data)
+            stream.write(sep)
+            stream.write(_dumps(self._file_entry(file_info)).replace(b"\n", b"\n    "))
+            sep = b",\n    "
+        stream.write(b"\n  ]\n}")
+        return b""
+    
+    def _file_entry(self, file_info) -> Dict[str, Any]:
+        """Build the JSON entry for one file."""
+        file_data = {
+            "path": file_info.path,
+            "size_bytes": file_info.size_bytes,
+            "lines": file_info.lines,
+            "words": file_info.words,
+            "mtime_iso": file_info.mtime_iso,
+            "language": _detect_language(file_info.path),
+            "content": file_info.content,  # Full source code content
+            "has_content": file_info.content is not None
+        }
         
-        return json.dumps(result, indent=2, ensure_ascii=False, default=str)
+        # Add enhanced metadata
+        if file_info.content:
+            file_data["content_preview"] = self._get_content_preview(file_info.content)
+            file_data["encoding"] = "utf-8"
+        return file_data
+    
+    def supports_streaming(self) -> bool:
+        return True
     
     def mimetype(self) -> str:
         return "application/json"
@@ -77,36 +162,6 @@ class FullContentJSONExporter(Exporter):
     def supports_bundling(self) -> bool:
         return True  # Can be used for complete project archival
     
-    def _detect_language(self, filepath: str) -> str:
-        """Detect programming language from file extension."""
-        from pathlib import Path
-        
-        ext = Path(filepath).suffix.lower()
-        language_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.html': 'html',
-            '.css': 'css',
-            '.md': 'markdown',
-            '.json': 'json',
-            '.yml': 'yaml',
-            '.yaml': 'yaml',
-            '.xml': 'xml',
-            '.txt': 'text',
-            '.sh': 'bash',
-            '.sql': 'sql',
-            '.java': 'java',
-            '.cpp': 'cpp',
-            '.c': 'c',
-            '.go': 'go',
-            '.rs': 'rust',
-            '.php': 'php',
-            '.rb': 'ruby'
-        }
-        
-        return language_map.get(ext, 'text')
-    
     def _get_content_preview(self, content: str, max_lines: int = 10) -> str:
         """Get a preview of file content (first N lines)."""
         if not content:
@@ -1,11 +1,68 @@
 """Full content Markdown exporter with complete source code."""
 from __future__ import annotations
 
+import functools
+import io
+import operator
 from pathlib import Path
 from typing import Any, Dict
 
 from .base import Exporter, register_exporter
 
+# File emoji by lower-cased extension (without the dot)
+_EMOJI_MAP = {
+    'py': '🐍',
+    'js': '📜',
+    'ts': '📘',
+    'html': '🌐',
+    'css': '🎨',
+    'md': '📝',
+    'json': '📋',
+    'yml': '⚙️',
+    'yaml': '⚙️',
+    'xml': '📄',
+    'txt': '📄',
+    'sh': '🔧',
+    'sql': '🗃️',
+    'java': '☕',
+    'cpp': '⚡',
+    'c': '⚡',
+    'go': '🐹',
+    'rs': '🦀',
+    'php': '🐘',
+    'rb': '💎'
+}
+_EMOJI_GET = _EMOJI_MAP.get
+
+# Sort key for FileInfo entries within a directory
+_path_key = operator.attrgetter("path")
+
+# Tree connector and child indent, indexed by "is last entry" (False/True)
+_BRANCH = ("├── ", "└── ")
+_INDENT = ("│   ", "    ")
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_size(size_bytes: int) -> str:
+    """Format file size in human-readable format."""
+    size = float(size_bytes)
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def _describe_file(path: str) -> tuple[str, str, str]:
+    """Return a relative path's file name, lower-cased extension (no dot) and emoji."""
+    filename = path.rpartition("/")[2]
+    stem, _, ext = filename.rpartition(".")
+    # Like os.path.splitext, leading dots (".gitignore") do not start an extension
+    if not stem.strip("."):
+        return filename, "", '📄'
+    ext = ext.lower()
+    return filename, ext, _EMOJI_GET(ext, '📄')
+
 
 @register_exporter
 class FullContentMarkdownExporter(Exporter):
@@ -15,73 +72,71 @@ class FullContentMarkdownExporter(Exporter):
     def name(self) -> str:
         return "full-content-markdown"
     
-    def render(self, analysis: Dict[str, Any], options: Dict[str, Any]) -> str:
-        """Render analysis with full file content as Markdown."""
+    def render(self, analysis: Dict[str, Any], options: Dict[str, Any]) -> bytes:
+        """Render analysis with full file content as UTF-8 Markdown."""
         # Get the raw project report from options if available
         project_report = options.get('project_report')
         if not project_report:
             raise ValueError("full-content-markdown exporter requires project_report in options")
         
+        # Sections are encoded as they are written so the (possibly multi-MB)
+        # report never exists as one big str that then needs a second, encoded copy
         root_name = Path(project_report.root).name
-        lines = [
-            f"# Project Structure: {root_name}\n",
-            f"**Generated:** {project_report.generated_at}  ",
-            f"**Root Path:** `{project_report.root}`",
-            "",
-            "⚠️ **Note:** This report includes complete source code content and can be used for project recovery.",
-            ""
-        ]
+        buf = io.BytesIO()
+        w = buf.write
         
-        # Summary statistics
+        # Summary statistics (one pass over the files)
         total_files = len(project_report.files)
-        total_size = sum(f.size_bytes for f in project_report.files)
-        text_files = sum(1 for f in project_report.files if f.content is not None)
-        total_lines = sum(f.lines if isinstance(f.lines, int) else 0 for f in project_report.files)
-        total_words = sum(f.words if isinstance(f.words, int) else 0 for f in project_report.files)
+        text_files = total_size = total_lines = total_words = 0
+        for f in project_report.files:
+            total_size += f.size_bytes
+            if isinstance(f.lines, int):
+                total_lines += f.lines
+            if isinstance(f.words, int):
+                total_words += f.words
+            if f.content is not None:
+                text_files += 1
         
-        lines.extend([
-            "## 📊 Summary",
-            "",
-            f"- **Total Files:** {total_files:,}",
-            f"- **Text Files:** {text_files:,}",
-            f"- **Total Size:** {self._format_size(total_size)}",
-            f"- **Total Lines:** {total_lines:,}",
-            f"- **Total Words:** {total_words:,}",
-            "",
-            "## 📁 File Listing",
-            ""
-        ])
+        w(
+            f"# Project Structure: {root_name}\n\n"
+            f"**Generated:** {project_report.generated_at}  \n"
+            f"**Root Path:** `{project_report.root}`\n\n"
+            "⚠️ **Note:** This report includes complete source code content and can be used for project recovery.\n\n"
+            "## 📊 Summary\n\n"
+            f"- **Total Files:** {total_files:,}\n"
+            f"- **Text Files:** {text_files:,}\n"
+            f"- **Total Size:** {_format_size(total_size)}\n"
+            f"- **Total Lines:** {total_lines:,}\n"
+            f"- **Total Words:** {total_words:,}\n\n"
+            "## 📁 File Listing\n\n".encode()
+        )
         
         # Build a tree structure from file paths
         tree = self._build_tree(project_report.files)
-        tree_lines = self._render_tree(tree)
-        lines.append('```')
-        lines.extend(tree_lines)
-        lines.append('```')
+        w(b"```\n")
+        w("".join([line + "\n" for line in self._render_tree(tree)]).encode())
+        w(b"```\n")
         
         # File contents section
-        lines.extend(["\n---\n", "## 📄 File Contents\n"])
+        w("\n---\n\n## 📄 File Contents\n\n".encode())
         
         for fi in project_report.files:
             if fi.content is None:
                 continue
                 
             # Detect file type for syntax highlighting
-            ext = Path(fi.path).suffix.lower().lstrip(".") or "text"
-            emoji = self._get_file_emoji(ext)
+            _, ext, emoji = _describe_file(fi.path)
+            ext = ext or "text"
             
-            lines.extend([
-                f"### {emoji} `{fi.path}`",
-                "",
-                f"**Size:** {self._format_size(fi.size_bytes)} | **Lines:** {fi.lines} | **Words:** {fi.words} | **Modified:** {fi.mtime_iso}",
-                "",
-                f"```{ext}",
-                fi.content.strip(),
-                "```",
-                ""
-            ])
+            w(
+                f"### {emoji} `{fi.path}`\n\n"
+                f"**Size:** {_format_size(fi.size_bytes)} | **Lines:** {fi.lines} | **Words:** {fi.words} | **Modified:** {fi.mtime_iso}\n\n"
+                f"```{ext}\n".encode()
+            )
+            w(fi.content.strip().encode())
+            w(b"\n```\n\n")
         
-        return "\n".join(lines) + "\n"
+        return buf.getvalue()
     
     def mimetype(self) -> str:
         return "text/markdown"
@@ -95,92 +150,68 @@ class FullContentMarkdownExporter(Exporter):
     def supports_bundling(self) -> bool:
         return True  # Can be used for complete project documentation
     
-    def _format_size(self, size_bytes: int) -> str:
-        """Format file size in human-readable format."""
-        size = float(size_bytes)
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
-    
-    def _get_file_emoji(self, ext: str) -> str:
-        """Get appropriate emoji for file extension."""
-        emoji_map = {
-            'py': '🐍',
-            'js': '📜',
-            'ts': '📘',
-            'html': '🌐',
-            'css': '🎨',
-            'md': '📝',
-            'json': '📋',
-            'yml': '⚙️',
-            'yaml': '⚙️',
-            'xml': '📄',
-            'txt': '📄',
-            'sh': '🔧',
-            'sql': '🗃️',
-            'java': '☕',
-            'cpp': '⚡',
-            'c': '⚡',
-            'go': '🐹',
-            'rs': '🦀',
-            'php': '🐘',
-            'rb': '💎'
-        }
-        return emoji_map.get(ext, '📄')
-    
     def _build_tree(self, files):
         """Build a nested tree structure from file paths."""
-        from collections import defaultdict
         tree = {}
+        # File list per directory path; the nested dicts are only walked the
+        # first time a directory is seen
+        dir_files = {}
         
         for fi in files:
-            parts = fi.path.split("/")
-            node = tree
-            for part in parts[:-1]:
-                node = node.setdefault(part, {})
-            node.setdefault("__files__", []).append(fi)
+            dirname = fi.path.rpartition("/")[0]
+            entries = dir_files.get(dirname)
+            if entries is None:
+                node = tree
+                if dirname:
+                    for part in dirname.split("/"):
+                        node = node.setdefault(part, {})
+                entries = dir_files[dirname] = node["__files__"] = []
+            entries.append(fi)
+        
+        # Sort each directory's files once here so rendering can walk them as-is
+        for entries in dir_files.values():
+            entries.sort(key=_path_key)
         
         return tree
     
-    def _render_tree(self, node, prefix_stack=None, level=0, is_last_dir=False):
+    def _render_tree(self, tree):
         """Render tree structure as ASCII art."""
-        if prefix_stack is None:
-            prefix_stack = []
-        
         out = []
-        keys = sorted(k for k in node.keys() if k != "__files__")
-        n_keys = len(keys)
+        append = out.append
         
-        for i, key in enumerate(keys):
-            is_last = (i == n_keys - 1 and not node.get("__files__"))
-            prefix = ""
-            for draw in prefix_stack:
-                prefix += ("│   " if draw else "    ")
+        # Explicit DFS stack; entries are popped in output order, so a node's
+        # file listing is pushed before (and emitted after) its subdirectories
+        stack = [("node", tree, "")]
+        while stack:
+            entry = stack.pop()
+            kind = entry[0]
             
-            branch = "└── " if is_last else "├── "
-            out.append(f"{prefix}{branch}📁 {key}/")
-            out.extend(self._render_tree(node[key], prefix_stack + [not is_last], level+1, is_last))
-        
-        # Render files in this directory
-        files = sorted(node.get("__files__", []), key=lambda f: f.path)
-        n_files = len(files)
-        
-        for j, fi in enumerate(files):
-            is_last_file = (j == n_files - 1)
-            prefix = ""
-            for draw in prefix_stack:
-                prefix += ("│   " if draw else "    ")
+            if kind == "node":
+                _, node, prefix = entry
+                files = node.get("__files__")
+                keys = sorted(k for k in node if k != "__files__")
+                if files:
+                    stack.append(("files", files, prefix))
+                last = len(keys) - 1
+                for i in range(last, -1, -1):
+                    key = keys[i]
+                    stack.append(("dir", key, node[key], prefix, i == last and not files))
+            
+            elif kind == "dir":
+                _, key, child, prefix, is_last = entry
+                append(f"{prefix}{_BRANCH[is_last]}📁 {key}/")
+                stack.append(("node", child, prefix + _INDENT[is_last]))
             
-            branch = "└── " if is_last_file else "├── "
-            size = self._format_size(fi.size_bytes)
-            lines_str = str(fi.lines) if fi.lines != "?" else "—"
-            words_str = str(fi.words) if fi.words != "?" else "—"
-            ext = Path(fi.path).suffix.lower().lstrip(".")
-            emoji = self._get_file_emoji(ext)
-            filename = Path(fi.path).name
-            meta = f"{size}, {lines_str} lines, {words_str} words, modified {fi.mtime_iso}"
-            out.append(f"{prefix}{branch}{emoji} {filename} [{meta}]")
+            else:
+                _, files, prefix = entry
+                last = len(files) - 1
+                for j, fi in enumerate(files):
+                    branch = _BRANCH[j == last]
+                    size = _format_size(fi.size_bytes)
+                    lines_str = str(fi.lines) if fi.lines != "?" else "—"
+                    words_str = str(fi.words) if fi.words != "?" else "—"
+                    filename, _, emoji = _describe_file(fi.path)
+                    meta = f"{size}, {lines_str} lines, {words_str} words, modified {fi.mtime_iso}"
+                    append(f"{prefix}{branch}{emoji} {filename} [{meta}]")
         
         return out
\ No newline at end of file
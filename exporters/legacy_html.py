@@ -1,40 +1,97 @@
 """Legacy format exporter that mimics the original outputs."""
 from __future__ import annotations
 
+import functools
+import io
+import operator
 from pathlib import Path
 from typing import Any, Dict
 
 from .base import Exporter, register_exporter
 
 
-@register_exporter
-class LegacyHTMLExporter(Exporter):
-    """HTML format matching the original output style with full content."""
-    
-    @property
-    def name(self) -> str:
-        return "legacy-html"
+def _esc(s: Any) -> str:
+    """HTML escape."""
+    # Chained str.replace runs each pass in C; a str.translate table with
+    # multi-character replacements is several times slower on large contents
+    return (str(s)
+            .replace('&', '&amp;')
+            .replace('<', '&lt;')
+            .replace('>', '&gt;')
+            .replace('"', '&quot;')
+            .replace("'", '&#39;'))
+
+
+# File contents are escaped in slices of this many characters, so a large file
+# never needs a second, fully escaped copy alongside the output buffer
+_ESC_CHUNK = 64 * 1024
+
+
+def _escape_to(write, text: str) -> None:
+    """HTML-escape text in chunks, passing each escaped chunk to write."""
+    for start in range(0, len(text), _ESC_CHUNK):
+        write(_esc(text[start:start + _ESC_CHUNK]))
+
+
+# File emoji by extension (without the dot)
+_EMOJI_MAP = {
+    'py': '🐍',
+    'js': '📜',
+    'ts': '📘',
+    'html': '🌐',
+    'css': '🎨',
+    'md': '📝',
+    'json': '📋',
+    'yml': '⚙️',
+    'yaml': '⚙️',
+    'xml': '📄',
+    'txt': '📄',
+    'sh': '🔧',
+    'sql': '🗃️'
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_size(size_bytes: int) -> str:
+    """Format file size in human-readable format."""
+    size = float(size_bytes)
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+_EMOJI_GET = _EMOJI_MAP.get
+
+
+def _describe_file(path: str) -> tuple[str, str]:
+    """Return a relative path's file name and emoji."""
+    filename = path.rpartition("/")[2]
+    stem, _, ext = filename.rpartition(".")
+    # Like Path.suffix, leading dots (".gitignore") do not start an extension
+    if not stem.strip("."):
+        return filename, '📄'
+    return filename, _EMOJI_GET(ext.lower(), '📄')
+
+
+# Sort key for FileInfo entries within a directory
+_path_key = operator.attrgetter("path")
+
+# Tree connector and child indent, indexed by "is last entry" (False/True)
+_BRANCH = ("├── ", "└── ")
+_INDENT = ("│   ", "    ")
+
+
+# Static document head around the <title> text (CSS is a modernised version of the original)
+_HEAD_OPEN = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="utf-8">
+    <title>Project Structure: """
+_HEAD_CLOSE = """</title>
+    <meta name="viewport" content="width=device-width, initial-scale=1">
     
-    def render(self, analysis: Dict[str, Any], options: Dict[str, Any]) -> str:
-        """Render analysis as HTML matching the original format."""
-        # Get the raw project report from options if available
-        project_report = options.get('project_report')
-        if not project_report:
-            raise ValueError("legacy-html exporter requires project_report in options")
-        
-        def esc(s):
-            """HTML escape."""
-            return (str(s)
-                    .replace('&', '&amp;')
-                    .replace('<', '&lt;')
-                    .replace('>', '&gt;')
-                    .replace('"', '&quot;')
-                    .replace("'", '&#39;'))
-        
-        root_name = Path(project_report.root).name
-        
-        # CSS styling (modernised version of original)
-        css = """
         <style>
         body { font-family: 'Inter', 'Segoe UI', Arial, sans-serif; background: #f9fafb; color: #222; margin: 0; padding: 0; }
         .container { max-width: 900px; margin: 2rem auto; background: #fff; border-radius: 10px; box-shadow: 0 2px 8px #0001; padding: 2rem; }
@@ -50,73 +107,88 @@ class LegacyHTMLExporter(Exporter):
         hr { border: none; border-top: 1px solid #e5e7eb; margin: 2rem 0; }
         .file-tree { background: #f8fafc; padding: 1rem; border-radius: 6px; border: 1px solid #e2e8f0; }
         </style>
-        """
         
-        # HTML structure
-        head = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <title>Project Structure: {root_name}</title>
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    {css}
 </head>
 <body>
 <div class="container">"""
+
+
+@register_exporter
+class LegacyHTMLExporter(Exporter):
+    """HTML format matching the original output style with full content."""
+    
+    @property
+    def name(self) -> str:
+        return "legacy-html"
+    
+    def render(self, analysis: Dict[str, Any], options: Dict[str, Any]) -> str:
+        """Render analysis as HTML matching the original format."""
+        # Get the raw project report from options if available
+        project_report = options.get('project_report')
+        if not project_report:
+            raise ValueError("legacy-html exporter requires project_report in options")
         
-        # Build content
-        out = [
-            head,
-            f"<h1>📁 Project Structure: {root_name}</h1>",
-            f'<div class="meta">Generated: {esc(project_report.generated_at)} | Root: <code>{esc(project_report.root)}</code></div>'
-        ]
+        root_name = Path(project_report.root).name
+        
+        # Build content (the static head only needs the title filled in)
+        buf = io.StringIO()
+        w = buf.write
+        w(_HEAD_OPEN)
+        w(root_name)
+        w(_HEAD_CLOSE)
+        w(f"\n<h1>📁 Project Structure: {root_name}</h1>\n")
+        w(f'<div class="meta">Generated: {_esc(project_report.generated_at)} | Root: <code>{_esc(project_report.root)}</code></div>\n')
         
         # Summary section
+        # One pass: totals plus the files whose content gets emitted below
         total_files = len(project_report.files)
-        total_size = sum(f.size_bytes for f in project_report.files)
-        text_files = sum(1 for f in project_report.files if f.content is not None)
+        total_size = 0
+        content_files = []
+        any_content = False
+        for f in project_report.files:
+            total_size += f.size_bytes
+            if f.content is not None:
+                content_files.append(f)
+                if f.content:
+                    any_content = True
+        text_files = len(content_files)
         
-        out.extend([
-            '<div class="summary">',
-            '<h2>📊 Summary</h2>',
-            f'<p><strong>Total Files:</strong> {total_files:,}<br>',
-            f'<strong>Text Files:</strong> {text_files:,}<br>',
-            f'<strong>Total Size:</strong> {esc(self._format_size(total_size))}</p>',
-            '</div>'
-        ])
+        w('<div class="summary">\n'
+          '<h2>📊 Summary</h2>\n'
+          f'<p><strong>Total Files:</strong> {total_files:,}<br>\n'
+          f'<strong>Text Files:</strong> {text_files:,}<br>\n'
+          f'<strong>Total Size:</strong> {_esc(_format_size(total_size))}</p>\n'
+          '</div>\n')
         
-        # File tree
-        out.append('<h2>📁 File Listing</h2>')
+        # File tree (escaping never touches newlines, so the lines are escaped as one block)
+        w('<h2>📁 File Listing</h2>\n')
         tree = self._build_tree(project_report.files)
         tree_lines = self._render_ascii_tree(tree)
-        out.append('<div class="file-tree">')
-        out.append('<pre><code>')
-        out.extend([esc(line) for line in tree_lines])
-        out.append('</code></pre>')
-        out.append('</div>')
+        w('<div class="file-tree">\n')
+        w('<pre><code>\n')
+        if tree_lines:
+            w(_esc("\n".join(tree_lines)))
+            w("\n")
+        w('</code></pre>\n')
+        w('</div>\n')
         
         # File contents
-        if any(f.content for f in project_report.files):
-            out.append('<hr>')
-            out.append('<h2>📄 File Contents</h2>')
+        if any_content:
+            w('<hr>\n')
+            w('<h2>📄 File Contents</h2>\n')
             
-            for fi in project_report.files:
-                if fi.content is None:
-                    continue
+            for fi in content_files:
+                emoji = _describe_file(fi.path)[1]
+                meta = f"Size: {_format_size(fi.size_bytes)} | Lines: {fi.lines} | Words: {fi.words} | Modified: {fi.mtime_iso}"
                 
-                emoji = self._get_file_emoji(Path(fi.path).suffix.lower())
-                meta = f"Size: {self._format_size(fi.size_bytes)} | Lines: {fi.lines} | Words: {fi.words} | Modified: {fi.mtime_iso}"
-                
-                out.extend([
-                    f'<h3>{emoji} <code>{esc(fi.path)}</code></h3>',
-                    f'<div class="content-header">{esc(meta)}</div>',
-                    '<pre><code>',
-                    esc(fi.content or ''),
-                    '</code></pre>'
-                ])
+                w(f'<h3>{emoji} <code>{_esc(fi.path)}</code></h3>\n')
+                w(f'<div class="content-header">{_esc(meta)}</div>\n')
+                w('<pre><code>\n')
+                _escape_to(w, fi.content)
+                w('\n</code></pre>\n')
         
-        out.extend(['</div>', '</body>', '</html>'])
-        return "\n".join(out)
+        w('</div>\n</body>\n</html>')
+        return buf.getvalue()
     
     def mimetype(self) -> str:
         return "text/html"
@@ -130,83 +202,68 @@ class LegacyHTMLExporter(Exporter):
     def supports_bundling(self) -> bool:
         return True  # Can be used for complete project documentation
     
-    def _format_size(self, size_bytes: int) -> str:
-        """Format file size in human-readable format."""
-        size = float(size_bytes)
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
-    
-    def _get_file_emoji(self, ext: str) -> str:
-        """Get appropriate emoji for file extension."""
-        ext = ext.lstrip('.')
-        emoji_map = {
-            'py': '🐍',
-            'js': '📜',
-            'ts': '📘',
-            'html': '🌐',
-            'css': '🎨',
-            'md': '📝',
-            'json': '📋',
-            'yml': '⚙️',
-            'yaml': '⚙️',
-            'xml': '📄',
-            'txt': '📄',
-            'sh': '🔧',
-            'sql': '🗃️'
-        }
-        return emoji_map.get(ext, '📄')
-    
     def _build_tree(self, files):
         """Build a nested tree structure from file paths."""
         tree = {}
+        # File list per directory path; the nested dicts are only walked the
+        # first time a directory is seen
+        dir_files = {}
+        
         for fi in files:
-            parts = fi.path.split("/")
-            node = tree
-            for part in parts[:-1]:
-                node = node.setdefault(part, {})
-            node.setdefault("__files__", []).append(fi)
+            dirname = fi.path.rpartition("/")[0]
+            entries = dir_files.get(dirname)
+            if entries is None:
+                node = tree
+                if dirname:
+                    for part in dirname.split("/"):
+                        node = node.setdefault(part, {})
+                entries = dir_files[dirname] = node["__files__"] = []
+            entries.append(fi)
+        
+        # Sort each directory's files once here so rendering can walk them as-is
+        for entries in dir_files.values():
+            entries.sort(key=_path_key)
+        
         return tree
     
-    def _render_ascii_tree(self, node, prefix_stack=None, level=0, is_last_dir=False):
+    def _render_ascii_tree(self, tree):
         """Render tree structure as ASCII art."""
-        if prefix_stack is None:
-            prefix_stack = []
-        
         out = []
-        keys = sorted(k for k in node.keys() if k != "__files__")
-        n_keys = len(keys)
+        append = out.append
         
-        for i, key in enumerate(keys):
-            is_last = (i == n_keys - 1 and not node.get("__files__"))
-            prefix = ""
-            for draw in prefix_stack:
-                prefix += ("│   " if draw else "    ")
+        # Explicit DFS stack; entries are popped in output order, so a node's
+        # file listing is pushed before (and emitted after) its subdirectories
+        stack = [("node", tree, "")]
+        while stack:
+            entry = stack.pop()
+            kind = entry[0]
             
-            branch = "└── " if is_last else "├── "
-            out.append(f"{prefix}{branch}📁 {key}/")
-            out.extend(self._render_ascii_tree(node[key], prefix_stack + [not is_last], level+1, is_last))
-        
-        # Render files in this directory
-        files = sorted(node.get("__files__", []), key=lambda f: f.path)
-        n_files = len(files)
-        
-        for j, fi in enumerate(files):
-            is_last_file = (j == n_files - 1)
-            prefix = ""
-            for draw in prefix_stack:
-                prefix += ("│   " if draw else "    ")
+            if kind == "node":
+                _, node, prefix = entry
+                files = node.get("__files__")
+                keys = sorted(k for k in node if k != "__files__")
+                if files:
+                    stack.append(("files", files, prefix))
+                last = len(keys) - 1
+                for i in range(last, -1, -1):
+                    key = keys[i]
+                    stack.append(("dir", key, node[key], prefix, i == last and not files))
+            
+            elif kind == "dir":
+                _, key, child, prefix, is_last = entry
+                append(f"{prefix}{_BRANCH[is_last]}📁 {key}/")
+                stack.append(("node", child, prefix + _INDENT[is_last]))
             
-            branch = "└── " if is_last_file else "├── "
-            size = self._format_size(fi.size_bytes)
-            lines_str = str(fi.lines) if fi.lines != "?" else "—"
-            words_str = str(fi.words) if fi.words != "?" else "—"
-            ext = Path(fi.path).suffix.lower()
-            emoji = self._get_file_emoji(ext)
-            filename = Path(fi.path).name
-            meta = f"{size}, {lines_str} lines, {words_str} words, modified {fi.mtime_iso}"
-            out.append(f"{prefix}{branch}{emoji} {filename} [{meta}]")
+            else:
+                _, files, prefix = entry
+                last = len(files) - 1
+                for j, fi in enumerate(files):
+                    branch = _BRANCH[j == last]
+                    size = _format_size(fi.size_bytes)
+                    lines_str = str(fi.lines) if fi.lines != "?" else "—"
+                    words_str = str(fi.words) if fi.words != "?" else "—"
+                    filename, emoji = _describe_file(fi.path)
+                    meta = f"{size}, {lines_str} lines, {words_str} words, modified {fi.mtime_iso}"
+                    append(f"{prefix}{branch}{emoji} {filename} [{meta}]")
         
         return out
\ No newline at end of file
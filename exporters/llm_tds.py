@@ -4,11 +4,24 @@ from __future__ import annotations
 import json
 import re
 from collections import Counter
+from operator import itemgetter
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding
+    orjson = None
+
 from .base import Exporter, register_exporter
 from analysis.schema import ProjectAnalysis
 
+# Whole words that could be dictionary entries: a maximal word run starting
+# with a letter or underscore, at least three characters long
+_WORD_RUN = re.compile(r'\b[A-Za-z_]\w{2,}\b')
+
+# Word-like tokens counted when building the dictionary
+_WORD_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_]{2,}')
+
 
 @register_exporter
 class LLMTDSExporter(Exporter):
@@ -18,9 +31,13 @@ class LLMTDSExporter(Exporter):
     def name(self) -> str:
         return "llm-tds"
     
-    def render(self, analysis: Dict[str, Any], options: Dict[str, Any]) -> str:
+    def render(self, analysis: ProjectAnalysis | Dict[str, Any], options: Dict[str, Any]) -> bytes | str:
         """Render analysis as LLM-TDS format."""
-        project_analysis = ProjectAnalysis(**analysis)
+        # A live model is used as-is; plain dicts still go through validation
+        if isinstance(analysis, ProjectAnalysis):
+            project_analysis = analysis
+        else:
+            project_analysis = ProjectAnalysis.model_validate(analysis)
         
         # Build token dictionary from all text content
         all_text = self._extract_all_text(project_analysis)
@@ -37,7 +54,7 @@ class LLMTDSExporter(Exporter):
                 "name": project_analysis.project.name,
                 "generated_at": project_analysis.generated_at.isoformat(),
                 "fingerprint": project_analysis.project.fingerprint,
-                "totals": project_analysis.project.totals.dict()
+                "totals": project_analysis.project.totals.model_dump()
             },
             "dictionary": dictionary,
             "content": {
@@ -46,6 +63,8 @@ class LLMTDSExporter(Exporter):
             }
         }
         
+        if orjson is not None:
+            return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
         return json.dumps(result, indent=2, ensure_ascii=False)
     
     def mimetype(self) -> str:
@@ -59,46 +78,43 @@ class LLMTDSExporter(Exporter):
     
     def _extract_all_text(self, analysis: ProjectAnalysis) -> str:
         """Extract all text content for dictionary building."""
-        text_parts = []
-        
-        # Add project metadata
-        text_parts.append(f"Project: {analysis.project.name}")
+        text_parts = [f"Project: {analysis.project.name}"]
+        append = text_parts.append
         
         # Add file information
         for file_info in analysis.files:
-            text_parts.append(f"File: {file_info.path}")
-            text_parts.append(f"Language: {file_info.language}")
+            append("File: " + file_info.path)
+            append("Language: " + file_info.language)
             
             if file_info.responsibility:
-                text_parts.append(f"Purpose: {file_info.responsibility}")
+                append("Purpose: " + file_info.responsibility)
             
             # Add imports
-            for imp in file_info.imports.internal + file_info.imports.external:
-                text_parts.append(f"Import: {imp}")
+            for imp in file_info.imports.internal:
+                append("Import: " + imp)
+            for imp in file_info.imports.external:
+                append("Import: " + imp)
             
             # Add class/function signatures
             for cls in file_info.classes:
-                text_parts.append(f"Class: {cls.name}")
+                append("Class: " + cls.name)
                 if cls.doc1:
-                    text_parts.append(cls.doc1)
+                    append(cls.doc1)
                 for method in cls.methods:
-                    text_parts.append(f"Method: {method}")
+                    append("Method: " + method)
             
             for func in file_info.functions:
-                text_parts.append(f"Function: {func.signature}")
+                append("Function: " + func.signature)
                 if func.doc1:
-                    text_parts.append(func.doc1)
+                    append(func.doc1)
         
         return " ".join(text_parts)
     
     def _build_token_dictionary(self, text: str, max_tokens: int) -> Dict[str, str]:
         """Build a dictionary of common tokens for compression."""
-        # Extract word-like tokens
-        word_pattern = re.compile(r'[A-Za-z_][A-Za-z0-9_]{2,}')
-        words = word_pattern.findall(text)
-        
-        # Count frequency
-        counter = Counter(words)
+        # Count word-like tokens straight off the match iterator, so the full token
+        # list is never materialised (most_common already selects via a heap)
+        counter = Counter(map(itemgetter(0), _WORD_PATTERN.finditer(text)))
         most_common = counter.most_common(max_tokens)
         
         # Build dictionary with token markers
@@ -114,14 +130,16 @@ class LLMTDSExporter(Exporter):
         # Reverse dictionary for lookup
         word_to_token = {word: token for token, word in dictionary.items()}
         
-        # Sort words by length (longest first) to avoid partial matches
-        sorted_words = sorted(word_to_token.keys(), key=len, reverse=True)
+        if not word_to_token:
+            return text
+        
+        # A \b-bounded dictionary word is always a complete word run, so scanning
+        # runs once and looking each up is equivalent to matching every word
+        # (longest first) and stays linear however large the dictionary is
+        get_token = word_to_token.get
         
-        # Replace words with tokens
-        result = text
-        for word in sorted_words:
-            # Use word boundaries to avoid partial replacements
-            pattern = r'\b' + re.escape(word) + r'\b'
-            result = re.sub(pattern, word_to_token[word], result)
+        def substitute(match: re.Match) -> str:
+            word = match[0]
+            return get_token(word, word)
         
-        return result
\ No newline at end of file
+        return _WORD_RUN.sub(substitute, text)
\ No newline at end of file
@@ -5,6 +5,11 @@ import json
 from dataclasses import fields
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding
+    orjson = None
+
 from .base import Exporter, register_exporter
 from outputs.lrc_capsule import LRCCapsuleOptions, build_lrc_capsule
 from report import ProjectReport
@@ -18,13 +23,15 @@ class LRCCapsuleExporter(Exporter):
     def name(self) -> str:
         return "lrc-capsule"
 
-    def render(self, analysis: Dict[str, Any], options: Dict[str, Any]) -> str:
+    def render(self, analysis: Dict[str, Any], options: Dict[str, Any]) -> bytes | str:
         project_report = options.get("project_report")
         if not isinstance(project_report, ProjectReport):
             raise ValueError("project_report is required to build an LRC capsule")
 
         capsule_options = self._build_options(options)
         capsule = build_lrc_capsule(project_report, capsule_options)
+        if orjson is not None:
+            return orjson.dumps(capsule, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
         return json.dumps(capsule, indent=2, ensure_ascii=False)
 
     def mimetype(self) -> str:
@@ -3,10 +3,86 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
 import re
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+try:
+    import ijson
+except ImportError:  # optional: streaming JSON recovery
+    ijson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional: fastest HTML recovery parser
+    LexborHTMLParser = None
+
+try:
+    import lxml.html
+except ImportError:  # optional: fast HTML recovery parser
+    lxml = None
+
+# Full-content Markdown structure: title line, per-file heading, code fence opener
+_TITLE_RE = re.compile(r'# Project Structure: (.+)$')
+_FILE_HEADER_RE = re.compile(r'### [^`]*`([^`]+)`')
+_FENCE_OPEN_RE = re.compile(r'```\w+')
+
+# Legacy HTML <title>, which carries the project name
+_HTML_TITLE_RE = re.compile(r'<title>Project Structure: ([^<]+)</title>')
+
+# Threads used to write recovered files, and how many writes may be queued
+_WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_MAX_PENDING_WRITES = 4 * _WRITE_WORKERS
+
+# Bytes read from the start of a .json export to find its "format" field
+# (the exporter always writes it first)
+_SNIFF_BYTES = 4096
+_JSON_FORMAT_RE = re.compile(rb'"format"\s*:\s*"full-content-json"')
+
+
+def _write_recovered(full_path: Path, content: str) -> None:
+    """Write one recovered file (its parent directory must exist)."""
+    with open(full_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def _write_files(recovery_dir: Path, files: Iterable[Tuple[str, str]]) -> int:
+    """Write (relative path, content) pairs under recovery_dir and return the count."""
+    recovered_count = 0
+    # Each parent directory is created once, before its first write is queued
+    made_dirs = set()
+    
+    # Writes are independent, so a small pool overlaps their syscalls;
+    # results are consumed in file order to keep the log ordered, and
+    # the backlog is capped so streamed contents do not pile up
+    with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+        pending = deque()
+        for path_str, content in files:
+            file_path = Path(path_str)
+            full_path = recovery_dir / file_path
+            parent = full_path.parent
+            if parent not in made_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                made_dirs.add(parent)
+            pending.append((file_path, executor.submit(_write_recovered, full_path, content)))
+            
+            if len(pending) >= _MAX_PENDING_WRITES:
+                file_path, future = pending.popleft()
+                future.result()
+                recovered_count += 1
+                print(f"✅ Recovered: {file_path}")
+        
+        for file_path, future in pending:
+            future.result()
+            recovered_count += 1
+            print(f"✅ Recovered: {file_path}")
+    
+    return recovered_count
 
 
 def recover_from_full_content_json(json_path: Path, output_dir: Path) -> int:
@@ -14,39 +90,35 @@ def recover_from_full_content_json(json_path: Path, output_dir: Path) -> int:
     print(f"📄 Reading JSON file: {json_path}")
     
     try:
-        with open(json_path, encoding='utf-8') as f:
-            data = json.load(f)
-        
-        if data.get('format') != 'full-content-json':
-            print(f"❌ Error: Not a full-content-json file (format: {data.get('format')})")
-            return 1
-        
-        metadata = data.get('metadata', {})
-        project_name = Path(metadata.get('root', 'recovered_project')).name
-        recovery_dir = output_dir / project_name
-        
-        print(f"📁 Creating recovery directory: {recovery_dir}")
-        recovery_dir.mkdir(parents=True, exist_ok=True)
-        
-        files = data.get('files', [])
-        recovered_count = 0
-        
-        for file_info in files:
-            if not file_info.get('has_content', False) or not file_info.get('content'):
-                continue
+        with open(json_path, 'rb') as f:
+            if ijson is not None:
+                # Stream: pull the header fields, then one file entry at a time
+                export_format = next(ijson.items(f, 'format'), None)
+                f.seek(0)
+                metadata = next(ijson.items(f, 'metadata'), {})
+                f.seek(0)
+                files = ijson.items(f, 'files.item')
+            else:
+                data = json.load(f)
+                export_format = data.get('format')
+                metadata = data.get('metadata', {})
+                files = data.get('files', [])
             
-            file_path = Path(file_info['path'])
-            full_path = recovery_dir / file_path
+            if export_format != 'full-content-json':
+                print(f"❌ Error: Not a full-content-json file (format: {export_format})")
+                return 1
             
-            # Create parent directories
-            full_path.parent.mkdir(parents=True, exist_ok=True)
+            project_name = Path(metadata.get('root', 'recovered_project')).name
+            recovery_dir = output_dir / project_name
             
-            # Write file content
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(file_info['content'])
+            print(f"📁 Creating recovery directory: {recovery_dir}")
+            recovery_dir.mkdir(parents=True, exist_ok=True)
             
-            recovered_count += 1
-            print(f"✅ Recovered: {file_path}")
+            recovered_count = _write_files(recovery_dir, (
+                (file_info['path'], file_info['content'])
+                for file_info in files
+                if file_info.get('has_content', False) and file_info.get('content')
+            ))
         
         print(f"\n🎉 Successfully recovered {recovered_count} files!")
         print(f"📍 Location: {recovery_dir}")
@@ -57,50 +129,59 @@ def recover_from_full_content_json(json_path: Path, output_dir: Path) -> int:
         return 1
 
 
+def _scan_fences(lines: Iterator[str]) -> Iterator[Tuple[str, str]]:
+    """Yield (path, fenced body) for each file block in full-content Markdown lines.
+    
+    A "### ...`path`" heading arms the next code fence, whose body runs until
+    a line opening with ```. Cheap startswith checks gate the regexes, so
+    body lines cost a single prefix test each.
+    """
+    current_path = None
+    for line in lines:
+        if line.startswith('### '):
+            header_match = _FILE_HEADER_RE.match(line)
+            if header_match:
+                current_path = header_match.group(1)
+        elif (current_path is not None and line.startswith('```')
+              and _FENCE_OPEN_RE.fullmatch(line.rstrip('\n'))):
+            buffer = []
+            append = buffer.append
+            for body_line in lines:
+                if body_line.startswith('```'):
+                    break
+                append(body_line)
+            else:
+                # Unterminated fence at end of file: nothing to recover
+                return
+            yield current_path, ''.join(buffer)
+            current_path = None
+
+
 def recover_from_full_content_markdown(md_path: Path, output_dir: Path) -> int:
     """Recover project from full-content-markdown format."""
     print(f"📄 Reading Markdown file: {md_path}")
     
     try:
         with open(md_path, encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract project name from title
-        title_match = re.search(r'^# Project Structure: (.+)$', content, re.MULTILINE)
-        if not title_match:
-            print("❌ Error: Not a full-content-markdown file (no project title found)")
-            return 1
-        
-        project_name = title_match.group(1).strip()
-        recovery_dir = output_dir / project_name
-        
-        print(f"📁 Creating recovery directory: {recovery_dir}")
-        recovery_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Find all file content blocks
-        file_pattern = re.compile(
-            r'^### [^`]*`([^`]+)`.*?```(\w+)\n(.*?)^```',
-            re.MULTILINE | re.DOTALL
-        )
-        
-        recovered_count = 0
-        for match in file_pattern.finditer(content):
-            file_path_str = match.group(1)
-            language = match.group(2)
-            file_content = match.group(3)
+            # Extract project name from title
+            for line in f:
+                title_match = _TITLE_RE.match(line)
+                if title_match:
+                    break
+            else:
+                print("❌ Error: Not a full-content-markdown file (no project title found)")
+                return 1
             
-            file_path = Path(file_path_str)
-            full_path = recovery_dir / file_path
+            project_name = title_match.group(1).strip()
+            recovery_dir = output_dir / project_name
             
-            # Create parent directories
-            full_path.parent.mkdir(parents=True, exist_ok=True)
+            print(f"📁 Creating recovery directory: {recovery_dir}")
+            recovery_dir.mkdir(parents=True, exist_ok=True)
             
-            # Write file content
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(file_content.rstrip() + '\n')
-            
-            recovered_count += 1
-            print(f"✅ Recovered: {file_path}")
+            recovered_count = _write_files(recovery_dir, (
+                (path_str, file_content.rstrip() + '\n')
+                for path_str, file_content in _scan_fences(f)
+            ))
         
         print(f"\n🎉 Successfully recovered {recovered_count} files!")
         print(f"📍 Location: {recovery_dir}")
@@ -111,6 +192,72 @@ def recover_from_full_content_markdown(md_path: Path, output_dir: Path) -> int:
         return 1
 
 
+# The backends below walk <h3> and <pre> elements once, in document order:
+# each file heading's path waits in `pending` until the next <pre> supplies
+# its content, instead of scanning forward for a <pre> from every heading
+def _html_blocks_selectolax(content: str) -> Iterator[Tuple[str, str]]:
+    """Yield (path, code text) pairs using selectolax's Lexbor (C) HTML parser."""
+    pending = []
+    for el in LexborHTMLParser(content).css('h3, pre'):
+        if el.tag == 'h3':
+            code_tag = el.css_first('code')
+            if code_tag is not None:
+                pending.append(code_tag.text().strip())
+        elif pending:
+            code = el.css_first('code')
+            if code is not None:
+                text = code.text()
+                for path in pending:
+                    yield path, text
+            pending.clear()
+
+
+def _html_blocks_lxml(content: str) -> Iterator[Tuple[str, str]]:
+    """Yield (path, code text) pairs using lxml's HTML parser."""
+    pending = []
+    for el in lxml.html.fromstring(content).iter('h3', 'pre'):
+        if el.tag == 'h3':
+            code_tag = el.find('.//code')
+            if code_tag is not None:
+                pending.append(code_tag.text_content().strip())
+        elif pending:
+            code = el.find('.//code')
+            if code is not None:
+                text = code.text_content()
+                for path in pending:
+                    yield path, text
+            pending.clear()
+
+
+def _html_blocks_bs4(content: str) -> Iterator[Tuple[str, str]]:
+    """Yield (path, code text) pairs using BeautifulSoup's pure-Python parser."""
+    from bs4 import BeautifulSoup
+    
+    pending = []
+    for el in BeautifulSoup(content, 'html.parser').find_all(['h3', 'pre']):
+        if el.name == 'h3':
+            code_tag = el.find('code')
+            if code_tag:
+                pending.append(code_tag.get_text().strip())
+        elif pending:
+            if el.code:
+                text = el.code.get_text()
+                for path in pending:
+                    yield path, text
+            pending.clear()
+
+
+def _html_file_blocks(content: str) -> Iterator[Tuple[str, str]]:
+    """Yield (path, code text) for each file section, using the fastest installed parser."""
+    if LexborHTMLParser is not None:
+        return _html_blocks_selectolax(content)
+    if lxml is not None:
+        return _html_blocks_lxml(content)
+    # BeautifulSoup is imported here so a missing install surfaces as ImportError
+    import bs4
+    return _html_blocks_bs4(content)
+
+
 def recover_from_legacy_html(html_path: Path, output_dir: Path) -> int:
     """Recover project from legacy-html format."""
     print(f"📄 Reading HTML file: {html_path}")
@@ -120,7 +267,7 @@ def recover_from_legacy_html(html_path: Path, output_dir: Path) -> int:
             content = f.read()
         
         # Extract project name from title
-        title_match = re.search(r'<title>Project Structure: ([^<]+)</title>', content)
+        title_match = _HTML_TITLE_RE.search(content)
         if not title_match:
             print("❌ Error: Not a legacy HTML file (no project title found)")
             return 1
@@ -133,84 +280,59 @@ def recover_from_legacy_html(html_path: Path, output_dir: Path) -> int:
         
         # Try to parse HTML for file content
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            recovered_count = 0
-            # Find all h3 elements with file paths, then look for following pre/code blocks
-            for h3 in soup.find_all('h3'):
-                code_tag = h3.find('code')
-                if not code_tag:
-                    continue
-                
-                file_path_str = code_tag.get_text().strip()
-                
-                # Find the next pre/code block
-                next_elem = h3.find_next_sibling()
-                while next_elem and next_elem.name != 'pre':
-                    next_elem = next_elem.find_next_sibling()
-                
-                if next_elem and next_elem.code:
-                    file_content = next_elem.code.get_text()
-                    
-                    file_path = Path(file_path_str)
-                    full_path = recovery_dir / file_path
-                    
-                    # Create parent directories
-                    full_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # Write file content
-                    with open(full_path, 'w', encoding='utf-8') as f:
-                        f.write(file_content.rstrip() + '\n')
-                    
-                    recovered_count += 1
-                    print(f"✅ Recovered: {file_path}")
-            
-            print(f"\n🎉 Successfully recovered {recovered_count} files!")
-            print(f"📍 Location: {recovery_dir}")
-            return 0
-            
+            blocks = _html_file_blocks(content)
         except ImportError:
-            print("❌ Error: BeautifulSoup4 is required for HTML parsing")
-            print("Install with: pip install beautifulsoup4")
+            print("❌ Error: an HTML parser is required (selectolax, lxml or BeautifulSoup4)")
+            print("Install with: pip install selectolax")
             return 1
         
+        # Each <h3> carries a file path; its following <pre><code> holds the content
+        recovered_count = _write_files(recovery_dir, (
+            (file_path_str, file_content.rstrip() + '\n')
+            for file_path_str, file_content in blocks
+        ))
+        
+        print(f"\n🎉 Successfully recovered {recovered_count} files!")
+        print(f"📍 Location: {recovery_dir}")
+        return 0
+        
     except Exception as e:
         print(f"❌ Error: {e}")
         return 1
 
 
+def _mapped_contains(file_path: Path, *markers: bytes) -> bool:
+    """Whether the file contains every marker, searched without reading it into memory."""
+    with open(file_path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return False
+        with mapped:
+            return all(mapped.find(marker) != -1 for marker in markers)
+
+
 def detect_format(file_path: Path) -> str:
     """Detect the export format of a file."""
     if not file_path.exists():
         return "unknown"
     
-    # Check by extension first
+    # Check by extension first; only the bytes needed to identify the format are looked at
     ext = file_path.suffix.lower()
-    if ext == '.json':
-        try:
-            with open(file_path, encoding='utf-8') as f:
-                data = json.load(f)
-            if data.get('format') == 'full-content-json':
+    try:
+        if ext == '.json':
+            with open(file_path, 'rb') as f:
+                head = f.read(_SNIFF_BYTES)
+            if _JSON_FORMAT_RE.search(head):
                 return 'full-content-json'
-        except:
-            pass
-    elif ext == '.md':
-        try:
-            with open(file_path, encoding='utf-8') as f:
-                content = f.read()
-            if 'This report includes complete source code content' in content:
+        elif ext == '.md':
+            if _mapped_contains(file_path, 'This report includes complete source code content'.encode()):
                 return 'full-content-markdown'
-        except:
-            pass
-    elif ext == '.html':
-        try:
-            with open(file_path, encoding='utf-8') as f:
-                content = f.read()
-            if 'Project Structure:' in content and '<pre><code>' in content:
+        elif ext == '.html':
+            if _mapped_contains(file_path, b'Project Structure:', b'<pre><code>'):
                 return 'legacy-html'
-        except:
-            pass
+    except OSError:
+        pass
     
     return "unknown"
 
@@ -6,13 +6,15 @@ from __future__ import annotations
 
 import threading
 import os
+from array import array
+from itertools import compress
 from pathlib import Path
-from tkinter import Tk, filedialog, ttk, StringVar, BooleanVar, messagebox, IntVar, Canvas
-from typing import Optional
+from tkinter import Tk, filedialog, ttk, StringVar, BooleanVar, messagebox, IntVar, Canvas, PhotoImage
+from typing import Iterator, Optional
 
 from report import EXCLUDED_DIRS, ProjectReport, format_size
 from scan import scan_project, is_content_readable
-from exporters.base import ExporterRegistry
+from exporters.base import ExporterRegistry, stream_to_path
 from ui import OptionsRenderer
 from analysis import AnalysisEngine
 import subprocess
@@ -20,6 +22,69 @@ import sys
 from config import ConfigManager
 
 
+# Icon colour per file preview Treeview tag; each tag shares one small image
+_TREE_TAG_COLORS = {
+    "folder": "#e0a526",
+    "python": "#3776ab",
+    "build": "#8b5a2b",
+    "doc": "#6c757d",
+    "data": "#2e8b57",
+    "config": "#7a5c99",
+    "web": "#e34c26",
+    "script": "#333333",
+    "source": "#0066cc",
+    "other": "#adb5bd",
+}
+# Icon size in pixels (a filled square inset by _TREE_ICON_INSET on each side)
+_TREE_ICON_SIZE = 16
+_TREE_ICON_INSET = 3
+
+# Main window background (pure white)
+_BG_COLOR = "#ffffff"
+
+# Tcl variable naming the theme an interpreter's app styles were applied to
+_STYLED_THEME_VAR = "::pph_styled_theme"
+
+# App ttk styles as one Tcl script, sent in a single round trip instead of
+# one Style.configure/Style.map call each. High contrast palette: text
+# #000000, accent #0066cc, window background #ffffff.
+_APP_STYLE_SCRIPT = """
+ttk::style configure Modern.TButton -background #0066cc -foreground white -borderwidth 0 -focuscolor none -padding {12 8}
+ttk::style map Modern.TButton -background {active #005a9e pressed #004080}
+
+ttk::style configure Secondary.TButton -background #6c757d -foreground white -borderwidth 0 -focuscolor none -padding {10 6}
+ttk::style map Secondary.TButton -background {active #545b62 pressed #3d4348}
+
+ttk::style configure Collapsible.TButton -anchor w -padding {12 8} -background #f0f0f0 -foreground #000000 -borderwidth 2 -relief solid -font {Helvetica 11 bold}
+ttk::style map Collapsible.TButton -background {active #e0e0e0} -foreground {active #000000}
+
+ttk::style configure Card.TFrame -background white -borderwidth 1 -relief solid
+
+ttk::style configure Heading.TLabel -background #ffffff -foreground #000000 -font {Helvetica 16 bold}
+ttk::style configure Subheading.TLabel -background white -foreground #000000 -font {Helvetica 12 bold}
+ttk::style configure Body.TLabel -background white -foreground #000000 -font {Helvetica 11}
+
+ttk::style configure Modern.TCombobox -fieldbackground white -foreground #000000 -borderwidth 2 -relief solid -font {Helvetica 11}
+
+ttk::style configure Modern.Horizontal.TProgressbar -background #0066cc -troughcolor #e9ecef -borderwidth 0 -lightcolor #0066cc -darkcolor #0066cc
+
+ttk::style configure Modern.Treeview -background white -foreground #000000 -fieldbackground white -borderwidth 1 -relief solid
+ttk::style configure Modern.Treeview.Heading -background #f8f9fa -foreground #000000 -relief flat
+
+ttk::style configure Body.TCheckbutton -background white -foreground #000000 -font {Helvetica 11 normal} -focuscolor none
+"""
+
+
+def _apply_app_styles(style: ttk.Style) -> None:
+    """Apply the app's ttk styles, once per interpreter and theme."""
+    tk = style.tk
+    theme = style.theme_use()
+    if tk.eval(f"info exists {_STYLED_THEME_VAR}") == "1" and tk.getvar(_STYLED_THEME_VAR) == theme:
+        return
+    tk.eval(_APP_STYLE_SCRIPT)
+    tk.setvar(_STYLED_THEME_VAR, theme)
+
+
 class CollapsibleSection(ttk.Frame):
     """Simple collapsible container with a header button."""
 
@@ -36,7 +101,7 @@ class CollapsibleSection(ttk.Frame):
         self.body = ttk.Frame(self)
         if initially_open:
             self.body.grid(row=1, column=0, sticky="nsew")
-        self.after(0, self._apply_pack_state)
+        self._request_layout()
 
     def _header_text(self) -> str:
         arrow = "▼" if self._open else "▶"
@@ -49,16 +114,17 @@ class CollapsibleSection(ttk.Frame):
         else:
             self.body.grid_remove()
         self._button.configure(text=self._header_text())
-        self._apply_pack_state()
-        # Look for callback on the root window (ExportApp instance)
+        self._request_layout()
+
+    def _request_layout(self) -> None:
+        """Queue this section's pack update with the root window's idle layout pass."""
+        # Look for the hook on the root window (ExportApp instance)
         root = self.winfo_toplevel()
-        if hasattr(root, '_section_toggle_callback'):
-            callback = getattr(root, '_section_toggle_callback', None)
-            if callable(callback):
-                try:
-                    callback()
-                except Exception:
-                    pass
+        request = getattr(root, '_request_section_layout', None)
+        if callable(request):
+            request(self)
+        else:
+            self.after_idle(self._apply_pack_state)
 
     def _apply_pack_state(self) -> None:
         if self.winfo_manager() == "pack":
@@ -69,22 +135,22 @@ class CollapsibleSection(ttk.Frame):
                 pass
 
 class ExportApp(Tk):
-    FILE_ICON_MAP: dict[str, str] = {
-        ".py": "🐍", ".pyw": "🐍", ".spec": "🛠️",
-        ".txt": "📄", ".md": "📝", ".rst": "📄",
-        ".json": "📋", ".yml": "⚙️", ".yaml": "⚙️",
-        ".toml": "⚙️", ".ini": "⚙️", ".cfg": "⚙️",
-        ".html": "🌐", ".htm": "🌐", ".css": "🎨",
-        ".js": "🟨", ".jsx": "🟨", ".ts": "🟦", ".tsx": "🟦",
-        ".sql": "🗄️", ".csv": "📊", ".log": "📜",
-        ".sh": "⚡", ".bat": "⚡", ".ps1": "⚡",
-        ".env": "🔒", ".dockerfile": "🐳",
-        ".go": "🐹", ".java": "☕",
-        ".c": "💾", ".h": "💾", ".cpp": "💾", ".hpp": "💾",
-        ".rs": "🦀", ".swift": "🕊️",
-        ".kt": "🧡", ".kts": "🧡",
-        ".php": "🐘", ".rb": "💎",
-        ".dart": "🎯",
+    # File preview category (Treeview tag) by extension; see _TREE_TAG_COLORS
+    FILE_CATEGORY_MAP: dict[str, str] = {
+        ".py": "python", ".pyw": "python", ".spec": "build",
+        ".txt": "doc", ".md": "doc", ".rst": "doc", ".log": "doc",
+        ".json": "data", ".csv": "data", ".sql": "data",
+        ".yml": "config", ".yaml": "config", ".toml": "config",
+        ".ini": "config", ".cfg": "config", ".env": "config", ".dockerfile": "config",
+        ".html": "web", ".htm": "web", ".css": "web",
+        ".js": "web", ".jsx": "web", ".ts": "web", ".tsx": "web",
+        ".sh": "script", ".bat": "script", ".ps1": "script",
+        ".go": "source", ".java": "source",
+        ".c": "source", ".h": "source", ".cpp": "source", ".hpp": "source",
+        ".rs": "source", ".swift": "source",
+        ".kt": "source", ".kts": "source",
+        ".php": "source", ".rb": "source",
+        ".dart": "source",
     }
 
     def __init__(self) -> None:
@@ -109,103 +175,9 @@ class ExportApp(Tk):
         else:
             style.theme_use(available_themes[0])
         
-        # Configure high contrast colors for maximum readability
-        bg_color = "#ffffff"  # Pure white background
-        accent_color = "#0066cc"  # Slightly darker blue
-        text_color = "#000000"  # Pure black text for maximum contrast
-        secondary_text_color = "#333333"  # Very dark gray for secondary text
-        border_color = "#cccccc"
-        
         # Main window styling
-        self.configure(bg=bg_color)
-        
-        # Button styles
-        style.configure("Modern.TButton", 
-                       background=accent_color,
-                       foreground="white",
-                       borderwidth=0,
-                       focuscolor="none",
-                       padding=(12, 8))
-        style.map("Modern.TButton",
-                 background=[('active', '#005a9e'), ('pressed', '#004080')])
-        
-        style.configure("Secondary.TButton",
-                       background="#6c757d",
-                       foreground="white", 
-                       borderwidth=0,
-                       focuscolor="none",
-                       padding=(10, 6))
-        style.map("Secondary.TButton",
-                 background=[('active', '#545b62'), ('pressed', '#3d4348')])
-        
-        style.configure("Collapsible.TButton", 
-                       anchor="w", 
-                       padding=(12, 8),
-                       background="#f0f0f0",
-                       foreground=text_color,
-                       borderwidth=2,
-                       relief="solid",
-                       font=("Helvetica", 11, "bold"))
-        style.map("Collapsible.TButton",
-                 background=[('active', '#e0e0e0')],
-                 foreground=[('active', text_color)])
-        
-        # Frame styles
-        style.configure("Card.TFrame",
-                       background="white",
-                       borderwidth=1,
-                       relief="solid")
-        
-        # Label styles with maximum contrast
-        style.configure("Heading.TLabel",
-                       background=bg_color,
-                       foreground=text_color,
-                       font=("Helvetica", 16, "bold"))
-        
-        style.configure("Subheading.TLabel",
-                       background="white",
-                       foreground=text_color,
-                       font=("Helvetica", 12, "bold"))
-        
-        style.configure("Body.TLabel",
-                       background="white",
-                       foreground=text_color,
-                       font=("Helvetica", 11))
-        
-        # Entry and Combobox styles
-        style.configure("Modern.TCombobox",
-                       fieldbackground="white",
-                       foreground=text_color,
-                       borderwidth=2,
-                       relief="solid",
-                       font=("Helvetica", 11))
-        
-        # Progress bar style
-        style.configure("Modern.Horizontal.TProgressbar",
-                       background=accent_color,
-                       troughcolor="#e9ecef",
-                       borderwidth=0,
-                       lightcolor=accent_color,
-                       darkcolor=accent_color)
-        
-        # Treeview style with better contrast
-        style.configure("Modern.Treeview",
-                       background="white",
-                       foreground=text_color,
-                       fieldbackground="white",
-                       borderwidth=1,
-                       relief="solid")
-        style.configure("Modern.Treeview.Heading",
-                       background="#f8f9fa",
-                       foreground=text_color,
-                       relief="flat")
-        
-        # Checkbutton style with better contrast
-        style.configure("Body.TCheckbutton",
-                       background="white",
-                       foreground=text_color,
-                       font=("Helvetica", 11, "normal"),
-                       focuscolor="none")
+        self.configure(bg=_BG_COLOR)
+        _apply_app_styles(style)
 
         # Set modern window geometry
         min_width, min_height = 900, 700
@@ -230,17 +202,35 @@ class ExportApp(Tk):
         self.file_count_var = IntVar(value=0)
         self.export_running = False
         self.node_states: dict[str, bool | None] = {}
+        # Display labels ("src/", "app.py"); the icon comes from the row's tag
         self.node_labels: dict[str, str] = {}
-        self.node_icons: dict[str, str] = {}
         self.tree_ready = False
         self._tree_build_id = 0
         self._tree_file_total = 0
         self._tree_root_id = "D:ROOT"
-        self.node_file_sizes: dict[str, int] = {}
+        # Per-file columns sorted by path (tree iid, relative path, size), so
+        # selection and size scans walk files only, without parsing iids
+        self._file_ids: list[str] = []
+        self._file_paths: list[str] = []
+        self._file_sizes: array = array('q')
+        # Node model: child rows per directory iid, parent iid per node, and the
+        # directories whose children are inserted in the Treeview ("" = top level)
+        self._tree_children: dict[str, list[tuple[str, str, str, str]]] = {}
+        self._tree_parent: dict[str, str] = {}
+        self._loaded_dirs: set[str] = set()
+        # Main window winfo_* results, dropped whenever the window is reconfigured
+        self._winfo_cache: dict[str, int] = {}
+        self.bind("<Configure>", self._on_root_configure, add="+")
+        # Layout work queued for the next idle pass (see _recalculate_minimum_height)
+        self._layout_pending = False
+        self._pending_sections: set[CollapsibleSection] = set()
         
         # Initialize exporter registry and get available formats
         self.registry = ExporterRegistry()
         self.available_formats = self._get_available_formats()
+        # Format lookups by registry name and by combobox display string
+        self._formats_by_name = {fmt['name']: fmt for fmt in self.available_formats}
+        self._formats_by_display = {fmt['display']: fmt for fmt in self.available_formats}
         self.format_extensions = self._build_format_extensions()
         self._options_cache: dict[str, dict[str, object]] = {}
         self.active_format_name: str | None = None
@@ -346,24 +336,17 @@ class ExportApp(Tk):
 
     def _format_from_name(self, name: str) -> dict[str, str] | None:
         """Get format info by name."""
-        for fmt in self.available_formats:
-            if fmt['name'] == name:
-                return fmt
-        return None
+        return self._formats_by_name.get(name)
 
     def _format_name_from_display(self, display: str) -> str | None:
         """Get format name from display string."""
-        for fmt in self.available_formats:
-            if fmt['display'] == display:
-                return fmt['name']
-        return None
+        fmt = self._formats_by_display.get(display)
+        return fmt['name'] if fmt is not None else None
 
     def _display_from_name(self, name: str) -> str | None:
         """Get display string from format name."""
-        for fmt in self.available_formats:
-            if fmt['name'] == name:
-                return fmt['display']
-        return None
+        fmt = self._formats_by_name.get(name)
+        return fmt['display'] if fmt is not None else None
 
     def _setup_ui(self) -> None:
         """Setup the complete user interface with modern design"""
@@ -415,9 +398,6 @@ class ExportApp(Tk):
         # Main content area with better spacing
         main_frame = ttk.Frame(main_container)
         main_frame.pack(fill="both", expand=True)
-        
-        # Store the callback reference for sections
-        self._section_toggle_callback = self._recalculate_minimum_height
 
         # Project selection section with modern card design
         project_section = CollapsibleSection(main_frame, "📁 Project Selection")
@@ -582,6 +562,16 @@ class ExportApp(Tk):
         self.file_tree.configure(xscrollcommand=tree_scroll_x.set)
 
         self.file_tree.bind("<Double-1>", self._on_tree_double_click)
+        self.file_tree.bind("<<TreeviewOpen>>", self._on_tree_open)
+
+        # One shared image per category tag, drawn here instead of per-row emoji
+        self._tree_icons: dict[str, PhotoImage] = {}
+        for tag, color in _TREE_TAG_COLORS.items():
+            icon = PhotoImage(master=self, width=_TREE_ICON_SIZE, height=_TREE_ICON_SIZE)
+            icon.put(color, to=(_TREE_ICON_INSET, _TREE_ICON_INSET,
+                                _TREE_ICON_SIZE - _TREE_ICON_INSET, _TREE_ICON_SIZE - _TREE_ICON_INSET))
+            self._tree_icons[tag] = icon
+            self.file_tree.tag_configure(tag, image=icon)
 
         # Save destination section with modern card design
         save_section = CollapsibleSection(main_frame, "💾 Save Destination")
@@ -702,11 +692,14 @@ class ExportApp(Tk):
     def _center_window(self) -> None:
         """Center the window on screen"""
         self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
+        # Pending geometry was just applied; its <Configure> may not be delivered yet
+        self._winfo_cache.clear()
+        width = self._winfo("winfo_width")
+        height = self._winfo("winfo_height")
+        x = (self._winfo("winfo_screenwidth") // 2) - (width // 2)
+        y = (self._winfo("winfo_screenheight") // 2) - (height // 2)
         self.geometry(f"{width}x{height}+{x}+{y}")
+        self._winfo_cache.clear()
         self._recalculate_minimum_height()
 
     # ---- Event Handlers ----
@@ -771,14 +764,17 @@ class ExportApp(Tk):
         """Reset the file selection tree and show a message."""
         if not hasattr(self, "file_tree") or self.file_tree is None:
             return
-        for child in self.file_tree.get_children():
-            self.file_tree.delete(child)
+        self.file_tree.delete(*self.file_tree.get_children())
         self.node_states.clear()
         self.node_labels.clear()
-        self.node_icons.clear()
+        self._tree_children = {}
+        self._tree_parent = {}
+        self._loaded_dirs = set()
         self.tree_ready = False
         self._tree_file_total = 0
-        self.node_file_sizes.clear()
+        self._file_ids = []
+        self._file_paths = []
+        self._file_sizes = array('q')
         try:
             self.file_tree.state(("disabled",))
         except Exception:
@@ -802,11 +798,25 @@ class ExportApp(Tk):
 
         def worker() -> None:
             try:
-                dirs_map, files_map, total_files, file_sizes = self._gather_tree_snapshot(target_path)
+                dirs_map, files_map, _, file_sizes = self._gather_tree_snapshot(target_path)
             except Exception as exc:
                 self.after(0, lambda: self._handle_tree_failure(str(exc), request_id))
                 return
-            self.after(0, lambda: self._populate_tree(dirs_map, files_map, total_files, file_sizes, request_id))
+            file_paths = sorted(file_sizes)
+            sizes = array('q', map(file_sizes.__getitem__, file_paths))
+            file_ids = [f"F:{path}" for path in file_paths]
+            # The whole node model is built here; the Tk thread only inserts the
+            # rows of directories that are open
+            children: dict[str, list[tuple[str, str, str, str]]] = {}
+            parents: dict[str, str] = {self._tree_root_id: ""}
+            labels: dict[str, str] = {}
+            for row in self._iter_tree_rows(self._tree_root_id, "", dirs_map, files_map):
+                parent_item, item_id, label, _ = row
+                children.setdefault(parent_item, []).append(row)
+                parents[item_id] = parent_item
+                labels[item_id] = label
+            self.after(0, lambda: self._populate_tree(
+                children, parents, labels, file_ids, file_paths, sizes, request_id))
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -881,45 +891,54 @@ class ExportApp(Tk):
 
     def _populate_tree(
         self,
-        dirs_map: dict[str, list[str]],
-        files_map: dict[str, list[str]],
-        total_files: int,
-        file_sizes: dict[str, int],
+        children: dict[str, list[tuple[str, str, str, str]]],
+        parents: dict[str, str],
+        labels: dict[str, str],
+        file_ids: list[str],
+        file_paths: list[str],
+        file_sizes: array,
         request_id: int
     ) -> None:
-        """Populate the UI tree with the gathered snapshot."""
+        """Install the worker's node model and show the root directory's entries."""
         if request_id != self._tree_build_id:
             return
 
         if not hasattr(self, "file_tree") or self.file_tree is None:
             return
 
-        for child in self.file_tree.get_children():
-            self.file_tree.delete(child)
-
-        self.node_states.clear()
-        self.node_labels.clear()
-        self.tree_ready = True
-        self._tree_file_total = total_files
-        self.node_file_sizes = file_sizes
+        self.file_tree.delete(*self.file_tree.get_children())
 
         root_label = f"{self.folder_path.name}/" if self.folder_path is not None else "Project/"
-        self.node_labels[self._tree_root_id] = root_label
-        self.node_states[self._tree_root_id] = True
-        self.node_icons[self._tree_root_id] = "📁"
+        labels[self._tree_root_id] = root_label
+        self.node_labels = labels
+        self.node_states = dict.fromkeys(parents, True)
+        self._tree_children = children
+        self._tree_parent = parents
+        self._loaded_dirs = {""}
+        self._tree_file_total = len(file_paths)
+        self._file_ids = file_ids
+        self._file_paths = file_paths
+        self._file_sizes = file_sizes
+
         self.file_tree.insert(
             "",
             "end",
             iid=self._tree_root_id,
             text="",
-            open=True
+            open=True,
+            tags=("folder",)
         )
         self._update_tree_item_text(self._tree_root_id)
+        self._load_children(self._tree_root_id)
+
+        self._finish_tree_population()
 
-        self._insert_tree_children(self._tree_root_id, "", dirs_map, files_map)
+    def _finish_tree_population(self) -> None:
+        """Enable the fully inserted tree and refresh the dependent UI."""
+        self.tree_ready = True
         self._restore_saved_selection()
 
-        if total_files == 0:
+        if self._tree_file_total == 0:
             self.tree_message.configure(text="No text-readable files found to include.")
         elif self.include_var.get():
             self.tree_message.configure(text="Double-click entries to include file contents in the export.")
@@ -929,46 +948,55 @@ class ExportApp(Tk):
         self._update_tree_enable_state()
         self._update_estimated_report_size()
 
-    def _insert_tree_children(
+    def _iter_tree_rows(
         self,
         parent_item: str,
         directory_key: str,
         dirs_map: dict[str, list[str]],
         files_map: dict[str, list[str]]
-    ) -> None:
-        """Insert directory and file nodes beneath the given parent."""
+    ) -> Iterator[tuple[str, str, str, str]]:
+        """Yield (parent, iid, label, tag) rows for the nodes beneath the given parent, parents first."""
         for dir_key in dirs_map.get(directory_key, []):
             name = dir_key.split('/')[-1] if '/' in dir_key else dir_key
-            label = f"{name}/"
             item_id = f"D:{dir_key}" if dir_key else self._tree_root_id
             if item_id == self._tree_root_id:
                 continue
-            self.node_labels[item_id] = label
-            self.node_states[item_id] = True
-            self.node_icons[item_id] = "📁"
-            self.file_tree.insert(
-                parent_item,
-                "end",
-                iid=item_id,
-                text="",
-                open=False
-            )
-            self._update_tree_item_text(item_id)
-            self._insert_tree_children(item_id, dir_key, dirs_map, files_map)
+            yield parent_item, item_id, f"{name}/", "folder"
+            yield from self._iter_tree_rows(item_id, dir_key, dirs_map, files_map)
 
         for file_key in files_map.get(directory_key, []):
-            name = file_key.split('/')[-1]
-            item_id = f"F:{file_key}"
-            self.node_labels[item_id] = name
-            self.node_states[item_id] = True
-            self.node_icons[item_id] = self._icon_for_file(file_key)
-            self.file_tree.insert(
-                parent_item,
-                "end",
-                iid=item_id,
-                text=""
-            )
-            self._update_tree_item_text(item_id)
+            name = file_key.rpartition('/')[2]
+            yield parent_item, f"F:{file_key}", name, self._file_category(file_key)
+
+    def _load_children(self, parent_id: str) -> None:
+        """Insert a directory's child rows (once), replacing its placeholder."""
+        if parent_id in self._loaded_dirs:
+            return
+        if self.file_tree.exists(f"L:{parent_id}"):
+            self.file_tree.delete(f"L:{parent_id}")
+        self._loaded_dirs.add(parent_id)
+        self._bulk_insert(self._tree_children.get(parent_id, ()))
+
+    def _on_tree_open(self, event) -> None:
+        """Materialise a directory's children when it is expanded."""
+        # ttk focuses the item before generating <<TreeviewOpen>>
+        item_id = self.file_tree.focus()
+        if item_id in self._tree_children:
+            self._load_children(item_id)
+
+    def _bulk_insert(self, rows) -> None:
+        """Insert pre-built (parent, iid, label, tag) rows with their current text."""
+        # Straight Tcl calls skip ttk.Treeview.insert's option marshalling and
+        # the follow-up item() call per node
+        tk_call = self.file_tree.tk.call
+        widget = self.file_tree._w
+        children = self._tree_children
+        for parent_item, item_id, _, tag in rows:
+            tk_call(widget, "insert", parent_item, "end", "-id", item_id,
+                    "-text", self._node_text(item_id), "-tags", tag)
+            if item_id in children:
+                # Placeholder child so the directory shows an expand arrow
+                tk_call(widget, "insert", item_id, "end", "-id", f"L:{item_id}")
 
     def _checkbox_prefix(self, state: bool | None) -> str:
         """Return the ASCII checkbox representation for a node state."""
@@ -978,35 +1006,41 @@ class ExportApp(Tk):
             return "[ ]"
         return "[~]"
 
-    def _update_tree_item_text(self, item_id: str) -> None:
-        """Refresh the displayed text for a tree node."""
+    def _node_text(self, item_id: str) -> str:
+        """Return the displayed text for a tree node."""
         label = self.node_labels.get(item_id, "")
         state = self.node_states.get(item_id, False)
-        icon = self.node_icons.get(item_id, "")
-        icon_prefix = f"{icon} " if icon else ""
-        self.file_tree.item(item_id, text=f"{self._checkbox_prefix(state)} {icon_prefix}{label}")
+        return f"{self._checkbox_prefix(state)} {label}"
 
-    def _icon_for_file(self, rel_path: str) -> str:
-        """Return an emoji to represent the file extension."""
-        ext = Path(rel_path).suffix.lower()
+    def _update_tree_item_text(self, item_id: str) -> None:
+        """Refresh the displayed text for a tree node, if it has been inserted."""
+        if self._tree_parent.get(item_id) in self._loaded_dirs:
+            self.file_tree.item(item_id, text=self._node_text(item_id))
+
+    def _file_category(self, rel_path: str) -> str:
+        """Return the preview tag (icon category) for a file's extension."""
+        name = rel_path.rpartition('/')[2]
+        # Same rule as Path.suffix, without building a Path per file
+        dot = name.rfind('.')
+        ext = name[dot:].lower() if 0 < dot < len(name) - 1 else ""
         if ext == "" and rel_path.lower().startswith("makefile"):
-            return "🛠️"
-        return self.FILE_ICON_MAP.get(ext, "📄")
+            return "build"
+        return self.FILE_CATEGORY_MAP.get(ext, "other")
 
     def _set_children_state(self, parent_id: str, state: bool) -> None:
         """Apply a state to all descendant nodes."""
-        for child_id in self.file_tree.get_children(parent_id):
+        for _, child_id, _, _ in self._tree_children.get(parent_id, ()):
             self.node_states[child_id] = state
             self._update_tree_item_text(child_id)
             self._set_children_state(child_id, state)
 
     def _update_parent_state(self, item_id: str) -> None:
         """Update parent nodes to reflect their children's combined state."""
-        parent_id = self.file_tree.parent(item_id)
+        parent_id = self._tree_parent.get(item_id)
         if not parent_id:
             return
 
-        child_states = [self.node_states.get(child) for child in self.file_tree.get_children(parent_id)]
+        child_states = [self.node_states.get(row[1]) for row in self._tree_children.get(parent_id, ())]
         if child_states and all(state is True for state in child_states):
             parent_state: bool | None = True
         elif child_states and all(state is False for state in child_states):
@@ -1053,8 +1087,10 @@ class ExportApp(Tk):
         self._toggle_tree_node(item_id)
 
         # Mirror the default Treeview behavior: double-click toggles expansion
-        if self.file_tree.get_children(item_id):
+        if item_id in self._tree_children:
             current_open = bool(self.file_tree.item(item_id, "open"))
+            if not current_open:
+                self._load_children(item_id)
             self.file_tree.item(item_id, open=not current_open)
         return "break"
 
@@ -1106,13 +1142,12 @@ class ExportApp(Tk):
         if not self.tree_ready or not self.node_states:
             return None
 
-        selected: set[str] = set()
-        for node_id, state in self.node_states.items():
-            if not node_id.startswith("F:"):
-                continue
-            if state is True:
-                selected.add(node_id[2:])
-        return selected
+        return set(compress(self._file_paths, self._selected_file_mask()))
+
+    def _selected_file_mask(self) -> list[bool]:
+        """Return per-file selection flags, aligned with the file columns."""
+        get_state = self.node_states.get
+        return [get_state(item_id) is True for item_id in self._file_ids]
 
     def _resolve_format_from_suffix(self, filename: str) -> str | None:
         """Map a file suffix to a known format name, if possible."""
@@ -1123,7 +1158,7 @@ class ExportApp(Tk):
                 return fmt_name
         return None
 
-    def _update_estimated_report_size(self, selected: Optional[set[str]] = None) -> None:
+    def _update_estimated_report_size(self) -> None:
         """Update the estimated report size label with high contrast styling."""
         if not self.include_var.get():
             self.size_hint_label.configure(text="📏 Estimated report size: contents excluded",
@@ -1135,23 +1170,21 @@ class ExportApp(Tk):
                                          foreground="#0066cc")
             return
 
-        if selected is None:
-            selected = self._get_selected_file_paths()
-            if selected is None:
-                self.size_hint_label.configure(text="📏 Estimated report size: calculating...",
-                                             foreground="#0066cc")
-                return
+        if not self.node_states:
+            self.size_hint_label.configure(text="📏 Estimated report size: calculating...",
+                                         foreground="#0066cc")
+            return
 
-        total_bytes = 0
-        for path in selected:
-            total_bytes += self.node_file_sizes.get(path, 0)
+        mask = self._selected_file_mask()
+        selected_count = sum(mask)
+        total_bytes = sum(compress(self._file_sizes, mask))
 
-        if not selected:
+        if not selected_count:
             self.size_hint_label.configure(text="📏 Estimated report size: minimal (no contents)",
                                          foreground="#006600")
             return
 
-        overhead = max(len(selected) * 256, 0)
+        overhead = max(selected_count * 256, 0)
         estimated = int(total_bytes * 1.1) + overhead
         human_readable = format_size(estimated)
         
@@ -1190,11 +1223,12 @@ class ExportApp(Tk):
         if self.folder_path is None or not self.node_states:
             return
 
-        excluded = sorted(
-            node_id[2:]
-            for node_id, state in self.node_states.items()
-            if node_id.startswith("F:") and state is not True
-        )
+        # File paths are kept sorted, so the exclusions come out in order
+        excluded = [
+            path
+            for path, selected in zip(self._file_paths, self._selected_file_mask())
+            if not selected
+        ]
         self.config_manager.update_content_exclusions(str(self.folder_path), excluded)
 
     def _update_deep_controls_visibility(self) -> None:
@@ -1631,13 +1665,17 @@ class ExportApp(Tk):
                     'include_content': include
                 }
                 export_options.update(format_specific_options)
-                output = exporter.render(analysis.model_dump(), export_options)
-                
-                # Write output
-                if isinstance(output, str):
-                    self.save_path.write_text(output, encoding='utf-8')
+                if exporter.supports_streaming():
+                    # Write straight to the file instead of holding the whole export in memory
+                    stream_to_path(exporter, analysis.model_dump(), export_options, self.save_path)
                 else:
-                    self.save_path.write_bytes(output)
+                    output = exporter.render(analysis.model_dump(), export_options)
+                    
+                    # Write output
+                    if isinstance(output, str):
+                        self.save_path.write_text(output, encoding='utf-8')
+                    else:
+                        self.save_path.write_bytes(output)
                 
                 # Success
                 self.after(0, lambda: self._export_success())
@@ -1720,22 +1758,56 @@ class ExportApp(Tk):
             self.destroy()
 
     # ---- Helper Methods ----
+    def _request_section_layout(self, section: CollapsibleSection) -> None:
+        """Queue a section's pack update for the next idle layout pass."""
+        self._pending_sections.add(section)
+        self._recalculate_minimum_height()
+
     def _recalculate_minimum_height(self) -> None:
+        """Schedule the minimum-height update; repeated requests share one idle pass."""
+        if not self._layout_pending:
+            self._layout_pending = True
+            self.after_idle(self._flush_layout)
+
+    def _flush_layout(self) -> None:
+        """Apply queued section pack states, then update the minimum height once."""
+        self._layout_pending = False
+        sections, self._pending_sections = self._pending_sections, set()
+        for section in sections:
+            section._apply_pack_state()
+        self._update_minimum_height()
+
+    def _update_minimum_height(self) -> None:
         """Shrink window height when sections collapse to avoid large gaps."""
         try:
             self.update_idletasks()
+            self._winfo_cache.clear()
             children = [child for child in self.winfo_children() if child.winfo_manager()]
             total_height = sum(child.winfo_reqheight() for child in children)
             padding = 40  # account for borders/margins
             min_height = max(total_height + padding, 420)
-            min_width = max(self.winfo_width(), 600)
+            min_width = max(self._winfo("winfo_width"), 600)
             self.minsize(600, min_height)
-            current_height = self.winfo_height()
+            current_height = self._winfo("winfo_height")
             if current_height > min_height:
                 self.geometry(f"{min_width}x{min_height}")
+                self._winfo_cache.clear()
         except Exception:
             pass
 
+    def _winfo(self, name: str) -> int:
+        """Return a main-window winfo_* value, querying Tk only after a reconfigure."""
+        value = self._winfo_cache.get(name)
+        if value is None:
+            value = self._winfo_cache[name] = getattr(self, name)()
+        return value
+
+    def _on_root_configure(self, event) -> None:
+        """Drop cached window metrics when the main window itself is reconfigured."""
+        # Child widgets' <Configure> events also reach the root's binding
+        if event.widget is self:
+            self._winfo_cache.clear()
+
     def _update_export_state(self) -> None:
         """Update export button state based on current selections"""
         enabled = (self.folder_path is not None and 
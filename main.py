@@ -2,6 +2,7 @@
 """Entry point: launch the GUI app with progress bar/export flow."""
 from __future__ import annotations
 
+import multiprocessing
 import traceback
 from tkinter import messagebox
 
@@ -15,4 +16,6 @@ def main() -> None:
         messagebox.showerror("Fatal Error", f"The application encountered a fatal error:\n{exc}")
 
 if __name__ == "__main__":
+    # Analysis fans out to worker processes; required for frozen builds
+    multiprocessing.freeze_support()
     main()
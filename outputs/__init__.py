@@ -363,8 +363,10 @@ def render_json(report: ProjectReport, include_contents: bool = True) -> str:
         "total_size_formatted": format_size(sum(f.size_bytes for f in report.files))
     }
     
-    if not include_contents:
-        for f in data["files"]:
+    for f in data["files"]:
+        # Scan bookkeeping for the analysis caches, not part of the report schema
+        del f["mtime_ns"]
+        if not include_contents:
             f["content"] = None
     
     return json.dumps(data, ensure_ascii=False, indent=2)
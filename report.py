@@ -133,6 +133,7 @@ class FileInfo:
     lines: int | str
     words: int | str
     content: str | None
+    mtime_ns: int = 0  # Raw modification time; 0 when unknown
 
 @dataclass
 class ProjectReport:
@@ -6,7 +6,7 @@ import datetime
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Tuple, Optional, Callable
+from typing import Callable, Iterator, Optional, Tuple
 
 from report import (
     CODE_EXTENSIONS,
@@ -80,23 +80,14 @@ def _is_hidden_or_excluded(name: str) -> bool:
             name in EXCLUDED_DIRS or
             name.lower() in {'thumbs.db', 'desktop.ini', '.ds_store'})
 
-def scan_project(root_path: Path, progress_callback: Optional[Callable[[str], None]] = None) -> ProjectReport:
-    """
-    Scan a project directory and build a comprehensive report.
+def _collect_files(root_path: Path) -> tuple[list[FileInfo], dict[Path, FileInfo]]:
+    """Walk the project and stat every file.
     
-    Args:
-        root_path: Root directory to scan
-        progress_callback: Optional callback for progress updates
-        
-    Returns:
-        ProjectReport with file information and content
+    Returns the files whose content will not be read, and a mapping of
+    absolute path to FileInfo for the text files that still need reading.
     """
-    if progress_callback:
-        progress_callback("Starting project scan...")
-    
-    files: list[FileInfo] = []
-    readable_paths: list[Path] = []
-    total_size = 0
+    plain_files: list[FileInfo] = []
+    readable: dict[Path, FileInfo] = {}
     
     # Walk directory tree
     try:
@@ -131,13 +122,14 @@ def scan_project(root_path: Path, progress_callback: Optional[Callable[[str], No
                         lines="?",
                         words="?",
                         content=None,
+                        mtime_ns=stat_result.st_mtime_ns,
                     )
-                    files.append(fi)
-                    total_size += stat_result.st_size
                     
                     # Add to readable files if it's a text file
                     if _is_text_file(file_path):
-                        readable_paths.append(file_path)
+                        readable[file_path] = fi
+                    else:
+                        plain_files.append(fi)
                         
                 except (PermissionError, OSError, ValueError):
                     # Skip files we can't access or process
@@ -146,43 +138,68 @@ def scan_project(root_path: Path, progress_callback: Optional[Callable[[str], No
     except (PermissionError, OSError) as e:
         raise RuntimeError(f"Cannot access project directory: {e}")
     
+    return plain_files, readable
+
+def iter_scanned_files(root_path: Path, progress_callback: Optional[Callable[[str], None]] = None) -> Iterator[FileInfo]:
+    """
+    Yield each file of a project as soon as its FileInfo is complete.
+    
+    Files whose content is not captured are yielded straight after the walk;
+    text files follow in read-completion order (not path order), so consumers
+    can start working while the remaining reads are in flight.
+    """
     if progress_callback:
-        progress_callback(f"Found {len(files)} files, reading {len(readable_paths)} text files...")
+        progress_callback("Starting project scan...")
+    
+    plain_files, readable = _collect_files(root_path)
+    
+    if progress_callback:
+        progress_callback(f"Found {len(plain_files) + len(readable)} files, reading {len(readable)} text files...")
+    
+    yield from plain_files
     
     # Read file contents in parallel for text files
-    if readable_paths:
-        max_threads = min(len(readable_paths), os.cpu_count() or MAX_THREADS_FALLBACK)
-        counts_map: dict[Path, tuple[int | str, int | str, str]] = {}
+    if readable:
+        total = len(readable)
+        max_threads = min(total, os.cpu_count() or MAX_THREADS_FALLBACK)
         
         try:
             with ThreadPoolExecutor(max_workers=max_threads) as executor:
                 # Submit all tasks
-                future_to_path = {
-                    executor.submit(_read_file_counts, path): path 
-                    for path in readable_paths
-                }
+                futures = [executor.submit(_read_file_counts, path) for path in readable]
                 
                 completed = 0
-                for future in as_completed(future_to_path):
+                for future in as_completed(futures):
                     path, lines, words, content = future.result()
-                    counts_map[path] = (lines, words, content)
+                    fi = readable.pop(path)
+                    fi.lines = lines
+                    fi.words = words
+                    fi.content = content
+                    yield fi
                     
                     completed += 1
                     if progress_callback and completed % 10 == 0:
-                        progress_callback(f"Read {completed}/{len(readable_paths)} files...")
+                        progress_callback(f"Read {completed}/{total} files...")
                         
         except Exception as e:
             if progress_callback:
                 progress_callback(f"Warning: Error reading some files: {e}")
         
-        # Update file info with counts and content
-        for fi in files:
-            full_path = root_path / fi.path
-            if full_path in counts_map:
-                lines, words, content = counts_map[full_path]
-                fi.lines = lines
-                fi.words = words
-                fi.content = content
+        # Anything left unread keeps its placeholder counts
+        yield from readable.values()
+
+def scan_project(root_path: Path, progress_callback: Optional[Callable[[str], None]] = None) -> ProjectReport:
+    """
+    Scan a project directory and build a comprehensive report.
+    
+    Args:
+        root_path: Root directory to scan
+        progress_callback: Optional callback for progress updates
+        
+    Returns:
+        ProjectReport with file information and content
+    """
+    files = list(iter_scanned_files(root_path, progress_callback))
     
     # Sort files by path for consistent output
     files.sort(key=lambda f: f.path.lower())
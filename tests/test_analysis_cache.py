@@ -0,0 +1,67 @@
+"""Per-file analysis cache tests."""
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from analysis import AnalysisEngine
+from scan import scan_project
+
+_SOURCE = '''"""Sample module."""
+import json
+
+
+class Greeter:
+    def greet(self, name):
+        return json.dumps({"hello": name})
+
+
+def main():
+    return Greeter().greet("world")
+'''
+
+
+class AnalysisCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.project = Path(tmp.name) / "project"
+        self.project.mkdir()
+        (self.project / "sample.py").write_text(_SOURCE, encoding="utf-8")
+        self.cache_dir = Path(tmp.name) / "cache"
+        patcher = mock.patch("analysis.engine._cache_dir", return_value=self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _analyze(self, with_content: bool):
+        report = scan_project(self.project)
+        if not with_content:
+            # What the GUI does for analysis formats without file contents
+            for fi in report.files:
+                fi.content = None
+        analysis = AnalysisEngine().analyze_project(report, {"workers": 1})
+        return next(fa for fa in analysis.files if fa.path == "sample.py")
+
+    def test_contentless_run_does_not_shadow_later_results(self) -> None:
+        empty = self._analyze(with_content=False)
+        self.assertEqual(empty.classes, [])
+
+        full = self._analyze(with_content=True)
+        self.assertEqual([cls.name for cls in full.classes], ["Greeter"])
+        self.assertIn("main", [func.name for func in full.functions])
+        self.assertIn("json", full.imports.external)
+
+        # Served from the cache on the next run
+        cached = self._analyze(with_content=True)
+        self.assertEqual(cached, full)
+
+    def test_cache_is_not_written_into_the_project(self) -> None:
+        self._analyze(with_content=True)
+        self.assertEqual(sorted(p.name for p in self.project.iterdir()), ["sample.py"])
+        self.assertTrue(any(self.cache_dir.rglob("*")))
+
+
+if __name__ == "__main__":
+    unittest.main()
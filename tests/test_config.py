@@ -0,0 +1,56 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import config
+
+
+class ConfigFlushTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = mock.patch.object(config, "_resolved_config_dir", return_value=Path(self._tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.manager = config.ConfigManager("test_config.json")
+        self.addCleanup(self._cancel_timer)
+
+    def _cancel_timer(self):
+        if self.manager._flush_timer is not None:
+            self.manager._flush_timer.cancel()
+
+    def _stored(self):
+        return json.loads(self.manager.config_path.read_text(encoding="utf-8"))
+
+    def test_updates_replace_dicts_instead_of_mutating_them(self):
+        cfg = self.manager.load_config()
+        exclusions, deep = cfg.content_exclusions, cfg.deep_options
+        self.manager.update_content_exclusions("/proj", ["a.py"])
+        self.manager.update_deep_options({"callgraph": False})
+        # The flush timer may be serializing the previous dicts concurrently
+        self.assertEqual(exclusions, {})
+        self.assertEqual(deep, {})
+        self.assertEqual(self.manager.get_content_exclusions("/proj"), ["a.py"])
+        self.assertEqual(self.manager.get_deep_options(), {"callgraph": False})
+
+        self.manager.update_content_exclusions("/proj", [])
+        self.assertEqual(self.manager.get_content_exclusions("/proj"), [])
+
+    def test_failed_write_stays_pending(self):
+        self.manager.update_deep_options({"callgraph": True})
+        self._cancel_timer()
+        with mock.patch.object(Path, "write_bytes", side_effect=OSError("disk full")), \
+                mock.patch.object(Path, "write_text", side_effect=OSError("disk full")):
+            self.manager._flush()
+        self.assertTrue(self.manager._dirty)
+        self.assertFalse(self.manager.config_path.exists())
+
+        self.manager._flush()
+        self.assertFalse(self.manager._dirty)
+        self.assertEqual(self._stored()["deep_options"], {"callgraph": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
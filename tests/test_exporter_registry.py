@@ -0,0 +1,95 @@
+"""Exporter registry tests."""
+from __future__ import annotations
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+BUILTIN_FORMATS = [
+    'llm-tds',
+    'basic-json',
+    'basic-markdown',
+    'full-content-json',
+    'full-content-markdown',
+    'legacy-html',
+    'lrc-capsule',
+]
+
+# Runs in a fresh interpreter: builds the GUI's format list the way gui.py does,
+# importing nothing from the exporters package but exporters.base
+_GUI_FORMATS_SCRIPT = """
+import types
+from exporters.base import ExporterRegistry
+from gui import ExportApp
+
+app = types.SimpleNamespace(registry=ExporterRegistry())
+app._guess_extension = lambda mimetype: ExportApp._guess_extension(app, mimetype)
+print(",".join(fmt["name"] for fmt in ExportApp._get_available_formats(app)))
+"""
+
+# Lists formats, then looks one up, reporting which exporter modules got imported
+_LAZY_LOAD_SCRIPT = """
+import sys
+import exporters
+
+def loaded():
+    return sorted(m for m in sys.modules if m.startswith("exporters.") and m != "exporters.base")
+
+print(",".join(exporters.list_available_formats()))
+print(",".join(loaded()))
+exporters.get_exporter("basic-json")
+print(",".join(loaded()))
+"""
+
+# A built-in import failing once must not leave the registry marked as loaded
+_RETRY_SCRIPT = """
+import exporters
+from exporters.base import ExporterRegistry
+
+real_load_all = exporters._load_all
+def failing_load_all():
+    exporters._load_all = real_load_all
+    raise ImportError("boom")
+exporters._load_all = failing_load_all
+
+try:
+    ExporterRegistry.list_formats()
+except ImportError:
+    pass
+print(ExporterRegistry._builtins_loaded)
+print(len(ExporterRegistry.list_formats()), ExporterRegistry._builtins_loaded)
+"""
+
+
+def _run(script: str) -> list[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    return result.stdout.splitlines()
+
+
+class ExporterRegistryTests(unittest.TestCase):
+    def test_gui_format_list_from_base_alone(self) -> None:
+        self.assertEqual(_run(_GUI_FORMATS_SCRIPT)[0].split(","), BUILTIN_FORMATS)
+
+    def test_listing_and_lookup_stay_lazy(self) -> None:
+        formats, after_listing, after_lookup = _run(_LAZY_LOAD_SCRIPT)
+        self.assertEqual(formats.split(","), BUILTIN_FORMATS)
+        self.assertEqual(after_listing, "")
+        self.assertEqual(after_lookup, "exporters.basic_json")
+
+    def test_failed_builtin_load_is_retried(self) -> None:
+        self.assertEqual(_run(_RETRY_SCRIPT), ["False", f"{len(BUILTIN_FORMATS)} True"])
+
+    def test_get_loads_builtins(self) -> None:
+        from exporters.base import ExporterRegistry
+        self.assertIsNotNone(ExporterRegistry.get('legacy-html'))
+        self.assertIsNone(ExporterRegistry.get('no-such-format'))
+
+
+if __name__ == "__main__":
+    unittest.main()
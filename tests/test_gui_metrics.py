@@ -0,0 +1,44 @@
+"""Main-window metric cache tests (no display needed)."""
+from __future__ import annotations
+
+import types
+import unittest
+
+from gui import ExportApp
+
+
+def _fake_window(width: int, height: int) -> types.SimpleNamespace:
+    """Window whose pending size is only applied by update_idletasks()."""
+    app = types.SimpleNamespace(size=(100, 100), pending=(width, height), geometries=[])
+    app._winfo_cache = {}
+    app._winfo = lambda name: ExportApp._winfo(app, name)
+    app.winfo_width = lambda: app.size[0]
+    app.winfo_height = lambda: app.size[1]
+    app.winfo_screenwidth = lambda: 1920
+    app.winfo_screenheight = lambda: 1080
+    app._recalculate_minimum_height = lambda: None
+
+    def update_idletasks() -> None:
+        app.size = app.pending
+
+    app.update_idletasks = update_idletasks
+    app.geometry = app.geometries.append
+    return app
+
+
+class CenterWindowTests(unittest.TestCase):
+    def test_center_uses_sizes_applied_by_update_idletasks(self) -> None:
+        app = _fake_window(800, 600)
+        # Cached before the layout settled; no <Configure> delivered since
+        self.assertEqual(app._winfo("winfo_width"), 100)
+        ExportApp._center_window(app)
+        self.assertEqual(app.geometries, ["800x600+560+240"])
+
+    def test_center_leaves_no_metrics_cached(self) -> None:
+        app = _fake_window(800, 600)
+        ExportApp._center_window(app)
+        self.assertEqual(app._winfo_cache, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
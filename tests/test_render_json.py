@@ -0,0 +1,31 @@
+import json
+import unittest
+
+from outputs import render_json
+from report import FileInfo, ProjectReport
+
+
+class RenderJsonTests(unittest.TestCase):
+    def _report(self):
+        info = FileInfo(
+            path="pkg/mod.py", size_bytes=12, mtime_iso="2024-01-01 00:00",
+            lines=1, words=2, content="print('hi')\n", mtime_ns=1_704_067_200_000_000_000,
+        )
+        return ProjectReport(root="/proj", generated_at="2024-01-01 00:00", files=[info])
+
+    def test_file_entries_keep_the_report_schema(self):
+        data = json.loads(render_json(self._report()))
+        self.assertEqual(
+            set(data["files"][0]),
+            {"path", "size_bytes", "mtime_iso", "lines", "words", "content"},
+        )
+        self.assertEqual(data["files"][0]["content"], "print('hi')\n")
+
+    def test_contents_can_be_left_out(self):
+        data = json.loads(render_json(self._report(), include_contents=False))
+        self.assertIsNone(data["files"][0]["content"])
+        self.assertNotIn("mtime_ns", data["files"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
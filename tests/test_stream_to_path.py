@@ -0,0 +1,48 @@
+"""Streaming export destination tests."""
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from exporters.base import stream_to_path
+
+
+class _ChunkExporter:
+    """Writes two chunks to the output stream, optionally failing in between."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+
+    def render(self, analysis, options):
+        stream = options['output_stream']
+        stream.write(b"new ")
+        if self.fail:
+            raise RuntimeError("render failed")
+        stream.write(b"export")
+
+
+class StreamToPathTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+        self.path = self.dir / "report.json"
+        self.path.write_bytes(b"previous export")
+
+    def test_success_replaces_destination(self) -> None:
+        stream_to_path(_ChunkExporter(), {}, {}, self.path)
+        self.assertEqual(self.path.read_bytes(), b"new export")
+        self.assertEqual([p.name for p in self.dir.iterdir()], ["report.json"])
+
+    def test_failed_render_keeps_existing_file(self) -> None:
+        options: dict = {}
+        with self.assertRaises(RuntimeError):
+            stream_to_path(_ChunkExporter(fail=True), {}, options, self.path)
+        self.assertEqual(self.path.read_bytes(), b"previous export")
+        self.assertEqual([p.name for p in self.dir.iterdir()], ["report.json"])
+        self.assertNotIn('output_stream', options)
+
+
+if __name__ == "__main__":
+    unittest.main()